@@ -13,10 +13,13 @@
 # limitations under the License.
 
 import math
+from functools import lru_cache
 from math import cos, sin
 from pathlib import Path
 from typing import Literal
 
+import numpy as np
+import OpenGL.GL as gl
 import pygame as pg
 from pygame.surface import Surface
 
@@ -27,14 +30,83 @@ from .custom_types import AColour, Colour, Coord2, RealNumber, DiscreteCoord2
 
 _FONT_OBJECT_CACHE: dict[tuple[str | None, int], pg.font.Font] = {}
 
-def draw_text(
-        surface: Surface, pos: DiscreteCoord2,
-        horiz_align: Literal['left', 'centre', 'right'],
-        vert_align: Literal['top', 'centre', 'bottom'],
+def gl_format_for_surface(surface: Surface) -> tuple[int, int] | None:
+    """Return the GL pixel format and packed type that read a 32-bit
+    surface's pixels as-is, or None if there aren't any.
+
+    With GL_UNSIGNED_INT_8_8_8_8_REV GL takes the first channel from the
+    lowest bits of each 32-bit pixel, and with GL_UNSIGNED_INT_8_8_8_8 from
+    the highest, so the format follows the surface's channel shifts and
+    holds on either byte order."""
+
+    if surface.get_bytesize() != 4:
+        return None
+
+    shifts = dict(zip("RGBA", surface.get_shifts()))
+    channel_order = ''.join(sorted("RGBA", key=shifts.__getitem__))
+    formats = {"RGBA": gl.GL_RGBA, "BGRA": gl.GL_BGRA}
+
+    if channel_order in formats:
+        return formats[channel_order], gl.GL_UNSIGNED_INT_8_8_8_8_REV
+    if channel_order[::-1] in formats:
+        return formats[channel_order[::-1]], gl.GL_UNSIGNED_INT_8_8_8_8
+    return None
+
+def create_surface_texture(surface: Surface) -> int:
+    """Create a linearly filtered texture with storage for the surface's
+    size, to be filled by upload_surface_texture."""
+
+    texture_id = gl.glGenTextures(1)
+    gl.glBindTexture(gl.GL_TEXTURE_2D, texture_id)
+    gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR)
+    gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR)
+    gl.glTexImage2D(
+        gl.GL_TEXTURE_2D, 0, gl.GL_RGBA8, *surface.get_size(), 0,
+        gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, None
+    )
+    gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+    return texture_id
+
+def upload_surface_texture(surface: Surface, texture_id: int) -> None:
+    """Copy a surface's pixels into a texture made by create_surface_texture,
+    leaving it bound. Rows are uploaded top to bottom, so the top of the
+    surface is at texture coordinate v = 0.
+
+    Where the surface's channel layout allows, its pixel buffer is passed
+    to GL directly rather than converted into a new bytes object."""
+
+    gl.glBindTexture(gl.GL_TEXTURE_2D, texture_id)
+    w, h = surface.get_size()
+    upload_format = gl_format_for_surface(surface)
+
+    if upload_format is None or surface.get_pitch() != w * 4:
+        gl.glTexSubImage2D(
+            gl.GL_TEXTURE_2D, 0, 0, 0, w, h,
+            gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, pg.image.tostring(surface, "RGBA")
+        )
+        return
+
+    # Packed 32-bit pixel types are read as one native-endian int per pixel
+    pixels = np.frombuffer(surface.get_view('1'), dtype=np.uint32)
+    gl.glTexSubImage2D(gl.GL_TEXTURE_2D, 0, 0, 0, w, h, *upload_format, pixels)
+    del pixels  # releases the surface lock held by the buffer view
+
+@lru_cache(maxsize=1024)
+def _render_text(font_obj: pg.font.Font, text: str, colour: Colour | AColour) -> Surface:
+    """Renders text once per (font, text, colour). Most HUD and menu
+    labels repeat every frame, so this saves re-rasterising them.
+
+    The returned surface is shared, so it must not be drawn on."""
+
+    return font_obj.render(text, True, colour)
+
+def render_text(
         text: str, colour: Colour | AColour,
-        font_size: int, font_family: pg.font.Font | Path | str | None = None,
-        rotation: float = 0
-    ) -> None:
+        font_size: int, font_family: pg.font.Font | Path | str | None = None
+    ) -> Surface:
+    """Returns the rendered text, using the same font object and render
+    caches as draw_text. The surface is shared, so it must not be drawn on."""
+
     if isinstance(font_family, pg.font.Font):
         font_obj = font_family
     else:
@@ -47,7 +119,17 @@ def draw_text(
         else:
             font_obj = _FONT_OBJECT_CACHE[font_obj_profile]
 
-    img = font_obj.render(text, True, colour)
+    return _render_text(font_obj, text, tuple(colour))
+
+def draw_text(
+        surface: Surface, pos: DiscreteCoord2,
+        horiz_align: Literal['left', 'centre', 'right'],
+        vert_align: Literal['top', 'centre', 'bottom'],
+        text: str, colour: Colour | AColour,
+        font_size: int, font_family: pg.font.Font | Path | str | None = None,
+        rotation: float = 0
+    ) -> None:
+    img = render_text(text, colour, font_size, font_family)
     if rotation != 0:
         img = pg.transform.rotate(img, rotation)
 
@@ -70,6 +70,16 @@ class Environment:
         self.sea_level = world_data.SEA_LEVEL
         self.h, self.w = self.height_array.shape
 
+        # Scalar lookups (height_at) run every tick, and are several times
+        # faster on plain Python floats than on numpy scalars, so they use
+        # a list copy of the heightmap and precomputed map_value factors
+        self._height_rows: list[list[float]] = self.height_array.tolist()
+        self._map_scale_x = self.w / (2 * HALF_WORLD_SIZE)
+        self._map_scale_z = self.h / (2 * HALF_WORLD_SIZE)
+        self._max_ix = self.w - (1+MATH_EPSILON)
+        self._max_iz = self.h - (1+MATH_EPSILON)
+        self._height_scale = (self.max_h - self.min_h) / 65535
+
         # Convert runway JSON to runway objects
         self.fonts = fonts  # Used for runway text
         self.images = images
@@ -132,6 +142,13 @@ class Environment:
                 tuple(zone["dims"])
             ) for zone in world_data.prohibited_zones
         ]
+        # Zones never move, so their (min x, max x, min z, max z) bounds are fixed
+        self.prohibited_zone_bounds: list[tuple[float, float, float, float]] = [
+            (
+                zone.pos[0] - zone.dims[0] / 2, zone.pos[0] + zone.dims[0] / 2,
+                zone.pos[1] - zone.dims[1] / 2, zone.pos[1] + zone.dims[1] / 2,
+            ) for zone in self.prohibited_zones
+        ]
 
         # Stars
         starfield_data_raw = world_data.starfield_data
@@ -170,19 +187,21 @@ class Environment:
     def height_at(self, x: float, z: float) -> float:
         """Returns the height at world coordinates x and z, in metres."""
 
-        ix, iz = self._world_to_map(x, z)
-        ix = np.clip(ix, 0, self.w - (1+MATH_EPSILON))
-        iz = np.clip(iz, 0, self.h - (1+MATH_EPSILON))
+        # Same mapping and clamping as _world_to_map and heights_at
+        ix = min(max(self._map_scale_x * (x + HALF_WORLD_SIZE), 0), self._max_ix)
+        iz = min(max(self._map_scale_z * (z + HALF_WORLD_SIZE), 0), self._max_iz)
 
         x1, y1 = int(ix), int(iz)
         x2, y2 = x1 + 1, y1 + 1
 
         fx, fy = ix - x1, iz - y1
 
-        h00 = self.height_array[y1, x1] # A
-        h10 = self.height_array[y1, x2] # B
-        h01 = self.height_array[y2, x1] # C
-        h11 = self.height_array[y2, x2] # D
+        row1 = self._height_rows[y1]
+        row2 = self._height_rows[y2]
+        h00 = row1[x1] # A
+        h10 = row1[x2] # B
+        h01 = row2[x1] # C
+        h11 = row2[x2] # D
 
         if self.diagonal_split == 'AD':
             # Diagonal AD splits the quad into triangles ABD and ACD
@@ -217,10 +236,46 @@ class Environment:
                 w = fx + fy - 1
                 interp = u * h10 + v * h01 + w * h11
 
-        raw_height = map_value(interp, 0, 65535, self.min_h, self.max_h)
-        final_height = raw_height
+        return self._height_scale * interp + self.min_h
+
+    def heights_at(self, x: np.ndarray, z: np.ndarray) -> np.ndarray:
+        """Vectorised height_at. Returns the heights at arrays of world
+        coordinates x and z, in metres."""
+
+        ix, iz = self._world_to_map(x, z)  # type: ignore[arg-type]
+        ix = np.clip(ix, 0, self.w - (1+MATH_EPSILON))
+        iz = np.clip(iz, 0, self.h - (1+MATH_EPSILON))
+
+        x1, y1 = ix.astype(np.int32), iz.astype(np.int32)
+        x2, y2 = x1 + 1, y1 + 1
+
+        fx, fy = ix - x1, iz - y1
+
+        h00 = self.height_array[y1, x1] # A
+        h10 = self.height_array[y1, x2] # B
+        h01 = self.height_array[y2, x1] # C
+        h11 = self.height_array[y2, x2] # D
+
+        if self.diagonal_split == 'AD':
+            # Triangle ABD where fy < fx, else triangle ACD
+            mask = fy < fx
+            u = np.where(mask, 1 - fx, 1 - fy)
+            v = np.where(mask, fx - fy, fy - fx)
+            w = np.where(mask, fy, fx)
+            interp = u * h00 + v * np.where(mask, h10, h01) + w * h11
+        else: # BC diagonal
+            # Triangle ABC where 1 - fx > fy, else triangle BCD
+            mask = 1 - fx > fy
+            u = np.where(mask, 1 - fx - fy, 1 - fy)
+            v = np.where(mask, fx, 1 - fx)
+            w = np.where(mask, fy, fx + fy - 1)
+            interp = (
+                u * np.where(mask, h00, h10)
+                + v * np.where(mask, h10, h01)
+                + w * np.where(mask, h01, h11)
+            )
 
-        return final_height
+        return map_value(interp, 0, 65535, self.min_h, self.max_h)  # type: ignore[return-value]
 
     def get_ground_height(self, x: float, z: float):
         """Fancier version of height_at that accounts for sea level"""
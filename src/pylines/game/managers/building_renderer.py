@@ -22,34 +22,87 @@ import OpenGL.GL as gl
 
 import pylines.core.constants as C
 from pylines.core.paths import DIRS
+from pylines.core.utils import clamp
 from pylines.core.time_manager import (
     fetch_hour,
     sun_direction_from_hour,
     sunlight_strength_from_hour,
 )
+from pylines.objects.building_parts import FLOATS_PER_VERTEX
 from pylines.shaders.shader_manager import load_shader_script
 
 if TYPE_CHECKING:
     from pylines.game.game import Game
+    from pylines.objects.buildings import Building
+
+# Layout of a building vertex in the VBO (24 bytes). Colour, normal and
+# emissive are stored as normalised integers, which GL converts back to
+# floats, so the shader is unchanged. The last byte of each is padding.
+_PACKED_VERTEX_DTYPE = np.dtype([
+    ("position", np.float32, 3),
+    ("colour", np.uint8, 4),
+    ("normal", np.int8, 4),
+    ("emissive", np.uint8, 4),
+])
+
+def _pack_vertices(vertices: np.ndarray) -> np.ndarray:
+    """Pack (N, 10) float vertices into _PACKED_VERTEX_DTYPE."""
+
+    packed = np.zeros(len(vertices), dtype=_PACKED_VERTEX_DTYPE)
+    packed["position"] = vertices[:, 0:3]
+    packed["colour"][:, :3] = np.rint(vertices[:, 3:6] * 255)
+    packed["normal"][:, :3] = np.rint(vertices[:, 6:9] * 127)
+    packed["emissive"][:, 0] = np.rint(vertices[:, 9] * 255)
+    return packed
 
 class BuildingRenderer:
+    CHUNK_GRID_SIZE = 16  # chunks along each world axis, for frustum culling
+
     def __init__(self, game: Game) -> None:
         self.game = game
 
         assert self.game.env is not None
 
         # Building rendering setup
-        all_vertices = []
-        for building in self.game.env.buildings:
-            all_vertices.extend(building.get_vertices())
-
-        if all_vertices:
-            self.vertices = np.array(all_vertices, dtype=np.float32)
-            self.vertex_count = len(self.vertices) // 10
+        # Group buildings into a grid of world chunks, ordered so that each
+        # chunk's vertices are one contiguous range of the VBO
+        def chunk_index(building: Building) -> int:
+            cx = int((building.pos.x + C.HALF_WORLD_SIZE) / (2 * C.HALF_WORLD_SIZE) * self.CHUNK_GRID_SIZE)
+            cz = int((building.pos.z + C.HALF_WORLD_SIZE) / (2 * C.HALF_WORLD_SIZE) * self.CHUNK_GRID_SIZE)
+            cx = int(clamp(cx, (0, self.CHUNK_GRID_SIZE - 1)))
+            cz = int(clamp(cz, (0, self.CHUNK_GRID_SIZE - 1)))
+            return cz * self.CHUNK_GRID_SIZE + cx
+
+        buildings = sorted(self.game.env.buildings, key=chunk_index)
+
+        # Each building writes straight into its own slice of one array
+        total_vertices = sum(building.vertex_count for building in buildings)
+        vertices = np.empty((total_vertices, FLOATS_PER_VERTEX), dtype=np.float32)
+        chunk_ranges: dict[int, list[int]] = {}  # chunk index, [first vertex, vertex count]
+        start = 0
+        for building in buildings:
+            end = start + building.vertex_count
+            building.write_vertices(vertices[start:end])
+            chunk_ranges.setdefault(chunk_index(building), [start, 0])[1] += end - start
+            start = end
+
+        # Per-chunk draw ranges and bounding boxes, in VBO order
+        self.chunk_firsts = np.array([first for first, _ in chunk_ranges.values()], dtype=np.int64)
+        self.chunk_counts = np.array([count for _, count in chunk_ranges.values()], dtype=np.int64)
+        self.chunk_mins = np.array([
+            vertices[first:first+count, 0:3].min(axis=0) for first, count in chunk_ranges.values()
+        ], dtype=np.float64).reshape(-1, 3)
+        self.chunk_maxs = np.array([
+            vertices[first:first+count, 0:3].max(axis=0) for first, count in chunk_ranges.values()
+        ], dtype=np.float64).reshape(-1, 3)
+
+        if total_vertices:
+            self.vertices = _pack_vertices(vertices)
+            self.vertex_count = total_vertices
 
             self.vbo = gl.glGenBuffers(1)
             gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo)
-            gl.glBufferData(gl.GL_ARRAY_BUFFER, self.vertices.nbytes, self.vertices, gl.GL_STATIC_DRAW)
+            gl.glBufferData(gl.GL_ARRAY_BUFFER, self.vertices.nbytes, self.vertices.view(np.uint8), gl.GL_STATIC_DRAW)
             gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
 
             self.shader = load_shader_script(
@@ -65,53 +118,113 @@ class BuildingRenderer:
             self.min_brightness_loc = gl.glGetUniformLocation(self.shader, "u_min_brightness")
             self.max_brightness_loc = gl.glGetUniformLocation(self.shader, "u_max_brightness")
             self.shade_multiplier_loc = gl.glGetUniformLocation(self.shader, "u_shade_multiplier")
+
+            # Record the attribute layout once in a vertex array object, so
+            # drawing is just a bind. Without VAO support (GL < 3.0) the
+            # attributes are set up on every draw instead.
+            self.vao = None
+            if gl.glGenVertexArrays:
+                self.vao = gl.glGenVertexArrays(1)
+                gl.glBindVertexArray(self.vao)
+                gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo)
+                self._enable_vertex_attributes()
+                gl.glBindVertexArray(0)
+                gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
         else:
-            self.vertices = np.array([], dtype=np.float32)
+            self.vertices = np.array([], dtype=_PACKED_VERTEX_DTYPE)
             self.vertex_count = 0
             self.vbo = None
+            self.vao = None
 
-    def draw(self, cloud_attenuation: float) -> None:
-        if not self.vertex_count or self.vbo is None:
-            return
-
-        gl.glUseProgram(self.shader)
-
-        # Set uniforms
-        current_hour = fetch_hour()
-        brightness = sunlight_strength_from_hour(current_hour) * cloud_attenuation
-        sun_direction = sun_direction_from_hour(current_hour)
-
-        gl.glUniform1f(self.brightness_loc, brightness)
-        gl.glUniform3f(self.sun_direction_loc, sun_direction.x, sun_direction.y, sun_direction.z)
-        gl.glUniform1f(self.min_brightness_loc, C.MOON_BRIGHTNESS)
-        gl.glUniform1f(self.max_brightness_loc, C.SUN_BRIGHTNESS)
-        gl.glUniform1f(self.shade_multiplier_loc, C.SHADE_BRIGHTNESS_MULT)
-
-        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo)
+    def _enable_vertex_attributes(self) -> None:
+        """Point the shader's attributes at the currently bound VBO."""
 
-        stride = 10 * ctypes.sizeof(ctypes.c_float)
+        stride = _PACKED_VERTEX_DTYPE.itemsize
+        fields = _PACKED_VERTEX_DTYPE.fields
+        assert fields is not None
 
         # Position
         gl.glEnableVertexAttribArray(self.pos_loc)
-        gl.glVertexAttribPointer(self.pos_loc, 3, gl.GL_FLOAT, gl.GL_FALSE, stride, ctypes.c_void_p(0))
+        gl.glVertexAttribPointer(self.pos_loc, 3, gl.GL_FLOAT, gl.GL_FALSE, stride, ctypes.c_void_p(fields["position"][1]))
 
         # Color
         gl.glEnableVertexAttribArray(self.color_loc)
-        gl.glVertexAttribPointer(self.color_loc, 3, gl.GL_FLOAT, gl.GL_FALSE, stride, ctypes.c_void_p(3 * ctypes.sizeof(ctypes.c_float)))
+        gl.glVertexAttribPointer(self.color_loc, 3, gl.GL_UNSIGNED_BYTE, gl.GL_TRUE, stride, ctypes.c_void_p(fields["colour"][1]))
 
         # Normal
         gl.glEnableVertexAttribArray(self.normal_loc)
-        gl.glVertexAttribPointer(self.normal_loc, 3, gl.GL_FLOAT, gl.GL_FALSE, stride, ctypes.c_void_p(6 * ctypes.sizeof(ctypes.c_float)))
+        gl.glVertexAttribPointer(self.normal_loc, 3, gl.GL_BYTE, gl.GL_TRUE, stride, ctypes.c_void_p(fields["normal"][1]))
 
         # Emissive
         gl.glEnableVertexAttribArray(self.emissive_loc)
-        gl.glVertexAttribPointer(self.emissive_loc, 1, gl.GL_FLOAT, gl.GL_FALSE, stride, ctypes.c_void_p(9 * ctypes.sizeof(ctypes.c_float)))
-
-        gl.glDrawArrays(gl.GL_TRIANGLES, 0, self.vertex_count)
+        gl.glVertexAttribPointer(self.emissive_loc, 1, gl.GL_UNSIGNED_BYTE, gl.GL_TRUE, stride, ctypes.c_void_p(fields["emissive"][1]))
 
+    def _disable_vertex_attributes(self) -> None:
         gl.glDisableVertexAttribArray(self.pos_loc)
         gl.glDisableVertexAttribArray(self.color_loc)
         gl.glDisableVertexAttribArray(self.normal_loc)
         gl.glDisableVertexAttribArray(self.emissive_loc)
-        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
-        gl.glUseProgram(0)
\ No newline at end of file
+
+    def _visible_chunks(self) -> np.ndarray:
+        """Return a boolean mask of the chunks whose bounding box is at least
+        partly inside the view frustum of the current GL matrices."""
+
+        # GL returns column-major matrices, so these products are transposed
+        modelview = gl.glGetFloatv(gl.GL_MODELVIEW_MATRIX)
+        projection = gl.glGetFloatv(gl.GL_PROJECTION_MATRIX)
+        clip = (modelview @ projection).T  # row-major projection * modelview
+
+        # Frustum planes (a, b, c, d), pointing inwards: left, right,
+        # bottom, top, near, far
+        planes = np.array([
+            clip[3] + clip[0], clip[3] - clip[0],
+            clip[3] + clip[1], clip[3] - clip[1],
+            clip[3] + clip[2], clip[3] - clip[2],
+        ], dtype=np.float64)
+        normals = planes[:, np.newaxis, 0:3]  # (6, 1, 3)
+
+        # A box is outside if its corner furthest along a plane's normal
+        # is still behind that plane
+        furthest = np.where(normals > 0, self.chunk_maxs, self.chunk_mins)  # (6, chunks, 3)
+        distances = (furthest * normals).sum(axis=2) + planes[:, np.newaxis, 3]
+        return (distances >= 0).all(axis=0)
+
+    def draw(self, cloud_attenuation: float) -> None:
+        if not self.vertex_count or self.vbo is None:
+            return
+
+        gl.glUseProgram(self.shader)
+
+        # Set uniforms
+        current_hour = fetch_hour()
+        brightness = sunlight_strength_from_hour(current_hour) * cloud_attenuation
+        sun_direction = sun_direction_from_hour(current_hour)
+
+        gl.glUniform1f(self.brightness_loc, brightness)
+        gl.glUniform3f(self.sun_direction_loc, sun_direction.x, sun_direction.y, sun_direction.z)
+        gl.glUniform1f(self.min_brightness_loc, C.MOON_BRIGHTNESS)
+        gl.glUniform1f(self.max_brightness_loc, C.SUN_BRIGHTNESS)
+        gl.glUniform1f(self.shade_multiplier_loc, C.SHADE_BRIGHTNESS_MULT)
+
+        # Draw only the chunks in view, merging runs of adjacent chunks
+        visible = self._visible_chunks()
+        run_edges = np.flatnonzero(np.diff(np.concatenate(([False], visible, [False])).astype(np.int8)))
+        draw_ranges = [
+            (int(self.chunk_firsts[run_start]), int(self.chunk_firsts[run_end - 1] + self.chunk_counts[run_end - 1] - self.chunk_firsts[run_start]))
+            for run_start, run_end in zip(run_edges[::2], run_edges[1::2])
+        ]
+
+        if self.vao is not None:
+            gl.glBindVertexArray(self.vao)
+            for first, count in draw_ranges:
+                gl.glDrawArrays(gl.GL_TRIANGLES, first, count)
+            gl.glBindVertexArray(0)
+        else:
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo)
+            self._enable_vertex_attributes()
+            for first, count in draw_ranges:
+                gl.glDrawArrays(gl.GL_TRIANGLES, first, count)
+            self._disable_vertex_attributes()
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+
+        gl.glUseProgram(0)
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import math
+import time
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, cast
 
@@ -39,8 +40,36 @@ class CockpitRenderer:
 
         # Setup persistent surfaces
         self.cockpit_rect = self.game.assets.images.cockpit.get_bounding_rect()
+        # Screen areas draw() touches while the plane is intact, besides the
+        # instrument panel (see panel_extent below): the stall/overspeed
+        # warnings above it when they're showing
+        warning_font = pg.font.Font(self.game.assets.fonts.monospaced, 50)
+        self.warning_extents: dict[str, pg.Rect] = {}
+        for text, centre in (("STALL", (C.WN_W//2, int(C.WN_H*0.62))), ("OVERSPEED", (C.WN_W//2, int(C.WN_H*0.57)))):
+            extent = pg.Rect((0, 0), warning_font.size(text))
+            extent.center = centre
+            self.warning_extents[text] = extent
         self.crash_colour_fade_surface: Surface = pg.Surface((C.WN_W, C.WN_H), pg.SRCALPHA)
-        self.static_cached_surface: Surface = self.populate_static_surface()
+        # Only the drawn part of the static surface is kept, so the
+        # per-frame blit doesn't walk the transparent rest of the screen
+        static_surface = self.populate_static_surface()
+        static_bounds = static_surface.get_bounding_rect()
+        self.static_cached_surface: Surface = static_surface.subsurface(static_bounds).copy()
+        self.static_cached_pos: tuple[int, int] = static_bounds.topleft
+
+        self.glidescope_ticks_surface: Surface = self.populate_glidescope_ticks_surface()
+
+        # Attitude indicator pitch chevrons, pointing up and down
+        self.ai_chevron_surfaces: tuple[Surface, Surface] = (
+            self.populate_chevron_surface(pointing_up=True),
+            self.populate_chevron_surface(pointing_up=False),
+        )
+
+        # V-bar sprites, upright and inverted, with the lines either side
+        self.v_bar_surfaces: tuple[Surface, Surface] = (
+            self.populate_v_bar_surface(inverted=False),
+            self.populate_v_bar_surface(inverted=True),
+        )
 
         # Setup attitude indicator mask
         ai_size = 170, 170
@@ -58,12 +87,25 @@ class CockpitRenderer:
         inner_ai_rect = pg.Rect(0, 0, ai_size[0]-4, ai_size[1]-4)
         self.ai_surface = pg.Surface(inner_ai_rect.size, pg.SRCALPHA)
 
+        # Clock readout text, refreshed when the wall-clock minute rolls over
+        self._clock_text: str = ""
+        self._clock_minute: int | None = None  # wall-clock minute (time.time() // 60) of _clock_text
+
         # Cache compasses to avoid wasteful per-frame rotations
         self.rotated_compasses: list[pg.Surface] = [
             pg.transform.rotate(self.game.assets.images.compass, theta)
             for theta in frange(0, 360, 360/C.COMPASS_QUANTISATION_STEPS)
         ]
 
+        # Screen area the instrument panel covers: the static instruments,
+        # plus the rotating compass card, which reaches above them
+        compass_centre = (C.WN_W//2-300, C.WN_H*0.85)
+        panel_bounds = static_bounds.unionall([
+            compass.get_bounding_rect().move(compass.get_rect(center=compass_centre).topleft)
+            for compass in self.rotated_compasses
+        ])
+        self.panel_extent = pg.Rect(0, panel_bounds.top, C.WN_W, C.WN_H - panel_bounds.top)
+
     def populate_ai_surface(self) -> Surface:
         width = 170 - 4
         height = 2000
@@ -212,6 +254,103 @@ class CockpitRenderer:
 
         return surface
 
+    V_BAR_SURFACE_SIZE = 80, 20
+    GLIDESCOPE_TICKS_SURFACE_SIZE = 20, 110
+    GLIDEPATH_SLOPE = math.tan(math.radians(3.0))  # glidescope is 3°
+
+    def populate_glidescope_ticks_surface(self) -> Surface:
+        """Pre-renders the glidescope's deviation tick marks, drawn
+        centred on the glidescope frame."""
+
+        w, h = self.GLIDESCOPE_TICKS_SURFACE_SIZE
+        surface = pg.Surface((w, h), flags=pg.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+        cx, cy = w//2, h//2
+
+        for tick_dy in (26, 52, -26, -52):
+            pg.draw.line(surface, (140, 140, 140), (cx-7, cy + tick_dy), (cx+6, cy + tick_dy), 2)
+
+        return surface
+
+    def populate_chevron_surface(self, pointing_up: bool) -> Surface:
+        """Pre-renders an attitude indicator pitch chevron: a red dart
+        with a white outline, tip up or down."""
+
+        chev_w = 18
+        chev_h = 10
+        w, h = 2 * (chev_w+7) + 1, chev_h + 5
+        surface = pg.Surface((w, h), flags=pg.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+
+        cx = w//2
+        base_y, tip_dir = (h - 3, -1) if pointing_up else (2, 1)
+
+        pg.draw.polygon(
+            surface, cols.WHITE,
+            [
+                (cx - (chev_w+7), base_y - 2*tip_dir),
+                (cx + (chev_w+7), base_y - 2*tip_dir),
+                (cx, base_y + (chev_h+2)*tip_dir),
+            ]
+        )
+        pg.draw.polygon(
+            surface, C.CHEVRON_COLOUR,
+            [
+                (cx - chev_w, base_y),
+                (cx + chev_w, base_y),
+                (cx, base_y + chev_h*tip_dir),
+            ]
+        )
+
+        return surface
+
+    def populate_v_bar_surface(self, inverted: bool) -> Surface:
+        """Pre-renders the attitude indicator's V-bar, drawn centred
+        on the indicator in front of the artificial horizon."""
+
+        w, h = self.V_BAR_SURFACE_SIZE
+        surface = pg.Surface((w, h), flags=pg.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+        cx, cy = w//2, h//2
+
+        # The two yellow lines either side of the V-bar
+        pg.draw.line(surface, (255, 255, 0), (cx-35, cy), (cx-15, cy), 3)
+        pg.draw.line(surface, (255, 255, 0), (cx+35, cy), (cx+15, cy), 3)
+
+        # V-bar itself, drawn inverted if the plane is inverted, so it always "points" in the direction of the nose
+        tip_dy = -5 if inverted else 5
+        pg.draw.line(surface, (255, 255, 0), (cx, cy), (cx-10, cy+tip_dy), 3)
+        pg.draw.line(surface, (255, 255, 0), (cx, cy), (cx+10, cy+tip_dy), 3)
+
+        return surface
+
+    def clock_text(self) -> str:
+        """Local time and UTC offset for the time readout. Only rebuilt
+        once a minute, as the local-time lookup is relatively slow."""
+
+        # Keyed on the wall clock itself, so a suspend/resume or a clock
+        # change shows up on the next frame rather than up to a minute later
+        minute = int(time.time() // 60)
+        if minute != self._clock_minute:
+            now = datetime.now().astimezone()
+            offset_hours = int(cast(timedelta, now.utcoffset()).total_seconds() // 3600)
+            self._clock_text = f"{now.hour:02d}:{now.minute:02d} ({offset_hours:+d})"
+            self._clock_minute = minute
+
+        return self._clock_text
+
+    def display_key(self, warn_stall: bool, warn_overspeed: bool) -> tuple:
+        """Everything draw() reads from the plane and clock, so the HUD
+        only needs redrawing for the cockpit when this changes, e.g. not
+        while the plane sits still on the ground."""
+
+        plane = self.plane
+        return (
+            *plane.pos, *plane.vel, *plane.get_rot(),
+            plane.throttle_frac, plane.flaps, plane.damage_level, plane.gps_runway_index,
+            warn_stall, warn_overspeed, self.clock_text(),
+        )
+
     def draw(self, surface: Surface, warn_stall: bool, warn_overspeed: bool) -> None:
         assert self.game.env is not None
 
@@ -241,6 +380,8 @@ class CockpitRenderer:
 
         # Setup
         pitch, yaw, roll = self.plane.get_rot()
+        vel_x, vel_y, vel_z = self.plane.vel
+        pos_x, pos_y, pos_z = self.plane.pos
 
         # Stall warning
         warning_x = C.WN_W//2-145
@@ -261,7 +402,7 @@ class CockpitRenderer:
             surface.blit(overlay, (0, 0))
 
         # Static cockpit surface
-        surface.blit(self.static_cached_surface, (0, C.WN_H - self.static_cached_surface.get_rect().height))
+        surface.blit(self.static_cached_surface, self.static_cached_pos)
 
         # Compass (heading + ground track)
         centre = (C.WN_W//2-300, C.WN_H*0.85)
@@ -269,17 +410,18 @@ class CockpitRenderer:
         rect = surf.get_rect(center=centre)
         surface.blit(surf, rect)
 
-        vel_flat = pg.Vector3(self.plane.vel.x, 0, self.plane.vel.z)
         ground_track_deg = math.degrees(
-            math.atan2(vel_flat.x, -vel_flat.z)
-        ) % 360 if vel_flat.length() >= C.MATH_EPSILON else 0
+            math.atan2(vel_x, -vel_z)
+        ) % 360 if vel_x*vel_x + vel_z*vel_z >= C.MATH_EPSILON * C.MATH_EPSILON else 0
 
+        # Horizontal offset to the selected runway, used by the compass,
+        # GPS readout and glidescope
         selected_runway: Runway = self.game.env.runways[self.plane.gps_runway_index]
-        gps_distance = selected_runway.pos - self.plane.pos
-        gps_distance_flat = pg.Vector3(gps_distance.x, 0, gps_distance.z)
+        gps_dx, gps_dz = selected_runway.pos.x - pos_x, selected_runway.pos.z - pos_z
+        gps_distance_flat = math.hypot(gps_dx, gps_dz)
         gps_bearing = math.degrees(
-            math.atan2(gps_distance_flat.x, -gps_distance_flat.z)
-        ) % 360 if gps_distance_flat.length() >= C.MATH_EPSILON else 0
+            math.atan2(gps_dx, -gps_dz)
+        ) % 360 if gps_distance_flat >= C.MATH_EPSILON else 0
 
         # Ground track (the actual velocity vector of the plane)
         draw_needle(surface, centre, 90 - (ground_track_deg-yaw), 100, (255, 190, 0))
@@ -288,18 +430,24 @@ class CockpitRenderer:
         # GPS distance (where the nose points)
         draw_needle(surface, centre, 90 - (gps_bearing-yaw), 100, (0, 255, 0))
 
-        # Show runway alignment (blue needle)
-        if gps_distance_flat.length() < 8000:
-            draw_needle(surface, centre, 90 - (selected_runway.heading-yaw), 50, (0, 120, 255))
-            draw_needle(surface, centre, 270 - (selected_runway.heading-yaw), 50, (0, 120, 255))
+        # Show runway alignment (blue needle). Both halves lie on one line
+        # through the centre, so it's drawn as a single line.
+        if gps_distance_flat < 8000:
+            alignment_rad = math.radians(90 - (selected_runway.heading-yaw))
+            half_dx = math.cos(alignment_rad) * 50
+            half_dy = math.sin(alignment_rad) * 50  # screen y is down
+            pg.draw.line(
+                surface, (0, 120, 255),
+                (centre[0] - half_dx, centre[1] + half_dy), (centre[0] + half_dx, centre[1] - half_dy), 3
+            )
 
         # ASI (Airspeed Indicator)
         centre = (C.WN_W//2+300, C.WN_H*0.85)
-        speed_knots = self.plane.vel.length() * 1.94384  # Convert to knots
+        speed_knots = math.sqrt(vel_x*vel_x + vel_y*vel_y + vel_z*vel_z) * 1.94384  # Convert to knots
         angle = 90 - min(336, 270 * speed_knots/160)
         draw_text(
             surface, (C.WN_W//2+300, int(C.WN_H*0.85 + 30)), 'centre', 'centre',
-            f"{int(self.plane.vel.length() * 1.94384):03d}", (192, 192, 192), 35, self.game.assets.fonts.monospaced
+            f"{int(speed_knots):03d}", (192, 192, 192), 35, self.game.assets.fonts.monospaced
         )
         draw_needle(surface, centre, angle, 100)
 
@@ -307,12 +455,12 @@ class CockpitRenderer:
         alt_centre = (C.WN_W//2 - 110, int(C.WN_H*0.74))
         draw_text(
             surface, (alt_centre[0], alt_centre[1]-15), 'centre', 'centre',
-            f"{self.plane.pos.y * 3.28084:,.0f} ft", cols.WHITE, 27, self.game.assets.fonts.monospaced
+            f"{pos_y * 3.28084:,.0f} ft", cols.WHITE, 27, self.game.assets.fonts.monospaced
         )
 
         # VSI (below altimeter)
         vsi_centre = (alt_centre[0], alt_centre[1]+15)
-        vs_ft_per_min = self.plane.vel.y * 196.85
+        vs_ft_per_min = vel_y * 196.85
         text_colour: Colour = cols.BLUE if vs_ft_per_min > 0 else cols.WHITE if vs_ft_per_min == 0 else cols.BROWN
         draw_text(
             surface, vsi_centre, 'centre', 'centre',
@@ -323,23 +471,20 @@ class CockpitRenderer:
         loc_centre = (C.WN_W//2 + 85, int(C.WN_H*0.74))
         draw_text(
             surface, loc_centre, 'centre', 'centre',
-            f"({self.plane.pos.x:,.0f}m, {self.plane.pos.z:,.0f}m)", cols.WHITE, 22, self.game.assets.fonts.monospaced
+            f"({pos_x:,.0f}m, {pos_z:,.0f}m)", cols.WHITE, 22, self.game.assets.fonts.monospaced
         )
 
         # Time readout
         time_centre = (C.WN_W//2 - 130, int(C.WN_H*0.81))
-
-        now = datetime.now().astimezone()
-        offset_hours = int(cast(timedelta, now.utcoffset()).total_seconds() // 3600)
         draw_text(
             surface, time_centre, 'centre', 'centre',
-            f"{now.hour:02d}:{now.minute:02d} ({offset_hours:+d})", cols.WHITE, 18, self.game.assets.fonts.monospaced
+            self.clock_text(), cols.WHITE, 18, self.game.assets.fonts.monospaced
         )
 
         # AGL readout
         agl_centre = (C.WN_W//2 + 130, int(C.WN_H*0.81))
-        x, z = self.plane.pos.x, self.plane.pos.z
-        altitude_agl = self.plane.pos.y - self.game.env.get_ground_height(x, z)
+        ground_height = self.game.env.get_ground_height(pos_x, pos_z)
+        altitude_agl = pos_y - ground_height
         draw_text(
             surface, (agl_centre[0] + 45, agl_centre[1]), 'right', 'centre',
             f"{units.convert_units(altitude_agl, units.METRES, units.FEET):,.0f} ft", cols.WHITE, 18, self.game.assets.fonts.monospaced
@@ -355,32 +500,29 @@ class CockpitRenderer:
 
         draw_text(
             surface, (gps_centre[0] - 35, gps_centre[1] + 14),
-            'left', 'centre', f"{gps_distance_flat.length() / 1000:,.2f}km", cols.WHITE, 20, self.game.assets.fonts.monospaced
+            'left', 'centre', f"{gps_distance_flat / 1000:,.2f}km", cols.WHITE, 20, self.game.assets.fonts.monospaced
         )
 
         # Glidescope
         glide_centre = (C.WN_W//2 + 105, int(C.WN_H*0.91))
 
-        # Compute comparison for glidescope
-        GLIDEPATH_SLOPE = math.tan(math.radians(3.0))  # glidescope is 3°
-        expected_height_above_runway = gps_distance_flat.length() * GLIDEPATH_SLOPE
-        expected_height_msl = expected_height_above_runway + selected_runway.pos.y
-        deviation = self.plane.pos.y - expected_height_msl
-
         # Display glidescope
         show_glidescope = (
-            gps_distance_flat.length() < 5_000 and  # runway is close
-            self.plane.pos.y > self.game.env.get_ground_height(self.plane.pos.x, self.plane.pos.z)  # plane is still in the air
+            gps_distance_flat < 5_000 and  # runway is close
+            pos_y > ground_height  # plane is still in the air
         )
 
         if show_glidescope:
             glide_centre_x, glide_centre_y = glide_centre
 
+            # Compute comparison for glidescope
+            expected_height_above_runway = gps_distance_flat * self.GLIDEPATH_SLOPE
+            expected_height_msl = expected_height_above_runway + selected_runway.pos.y
+            deviation = pos_y - expected_height_msl
+
             # Tick marks
-            pg.draw.line(surface, (140, 140, 140), (glide_centre_x-7, glide_centre_y + 26), (glide_centre_x+6, glide_centre_y + 26), 2)
-            pg.draw.line(surface, (140, 140, 140), (glide_centre_x-7, glide_centre_y + 52), (glide_centre_x+6, glide_centre_y + 52), 2)
-            pg.draw.line(surface, (140, 140, 140), (glide_centre_x-7, glide_centre_y - 26), (glide_centre_x+6, glide_centre_y - 26), 2)
-            pg.draw.line(surface, (140, 140, 140), (glide_centre_x-7, glide_centre_y - 52), (glide_centre_x+6, glide_centre_y - 52), 2)
+            ticks_w, ticks_h = self.GLIDESCOPE_TICKS_SURFACE_SIZE
+            surface.blit(self.glidescope_ticks_surface, (glide_centre_x - ticks_w//2, glide_centre_y - ticks_h//2))
 
             # Green circle
             pg.draw.circle(surface, (0, 255, 0), (glide_centre_x, glide_centre_y + clamp(deviation, (-10, 10)) * 52/10), 5)
@@ -402,7 +544,6 @@ class CockpitRenderer:
         pg.draw.rect(surface, (220, 220, 220), rect)
 
         # Attitude indicator
-        self.ai_surface.fill((0, 0, 0, 0))  # clear AI surface
         ai_centre = (C.WN_W//2, int(C.WN_H*0.89))
         ai_size = 170, 170
         ai_rect = pg.Rect(0, 0, *ai_size)
@@ -426,18 +567,15 @@ class CockpitRenderer:
         # Horizon position (in local AI coords)
         horizon_y = inner_ai_rect.height // 2 - pitch_display * tick_spacing
 
-        # Sky (above horizon)
-        pg.draw.rect(
-            self.ai_surface,
-            cols.DARK_BLUE,
-            (0, 0, inner_ai_rect.width, horizon_y)
-        )
+        # Sky, filling the whole indicator so that it also clears the last frame
+        self.ai_surface.fill(cols.DARK_BLUE)
 
-        # Ground (below horizon)
+        # Ground (below horizon). One row taller so a fractional horizon
+        # can't leave the bottom row as sky; the surface clips the overdraw.
         pg.draw.rect(
             self.ai_surface,
             cols.DARK_BROWN,
-            (0, horizon_y, inner_ai_rect.width, inner_ai_rect.height - horizon_y)
+            (0, horizon_y, inner_ai_rect.width, inner_ai_rect.height - horizon_y + 1)
         )
 
         cached_center_y = self.cached_ai_surface.get_height() // 2
@@ -446,54 +584,25 @@ class CockpitRenderer:
             (0, horizon_y - cached_center_y),
         )
 
-        cx = inner_ai_rect.width // 2
-        top_y = 20
-        bot_y = inner_ai_rect.height - 20
-        chev_w = 18
-        chev_h = 10
+        # Pitch chevrons, pointing back towards the horizon
+        chevron_w, chevron_h = self.ai_chevron_surfaces[0].get_size()
+        chevron_x = inner_ai_rect.width // 2 - chevron_w // 2
 
         # Nose too low -> point up
         if pitch_display >= C.CHEVRON_ANGLE:
-            pg.draw.polygon(
-                self.ai_surface, cols.WHITE,
-                [
-                    (cx - (chev_w+7), bot_y+2),
-                    (cx + (chev_w+7), bot_y+2),
-                    (cx, bot_y - (chev_h+2)),
-                ]
-            )
-            pg.draw.polygon(
-                self.ai_surface, C.CHEVRON_COLOUR,
-                [
-                    (cx - chev_w, bot_y),
-                    (cx + chev_w, bot_y),
-                    (cx, bot_y - chev_h),
-                ]
-            )
+            bot_y = inner_ai_rect.height - 20
+            self.ai_surface.blit(self.ai_chevron_surfaces[0], (chevron_x, bot_y + 2 - (chevron_h - 1)))
         # Nose too high -> point down
         elif pitch_display <= -C.CHEVRON_ANGLE:
-            pg.draw.polygon(
-                self.ai_surface, cols.WHITE,
-                [
-                    (cx - (chev_w+7), top_y-2),
-                    (cx + (chev_w+7), top_y-2),
-                    (cx, top_y + (chev_h+2)),
-                ]
-            )
-            pg.draw.polygon(
-                self.ai_surface, C.CHEVRON_COLOUR,
-                [
-                    (cx - chev_w, top_y),
-                    (cx + chev_w, top_y),
-                    (cx, top_y + chev_h),
-                ]
-            )
+            top_y = 20
+            self.ai_surface.blit(self.ai_chevron_surfaces[1], (chevron_x, top_y - 2))
 
         rotated_ai = pg.transform.rotate(self.ai_surface, roll_display)
         rot_rect = rotated_ai.get_rect(center=(inner_ai_rect.width//2, inner_ai_rect.height//2))
 
-        masked = pg.Surface(inner_ai_rect.size, pg.SRCALPHA)
-        masked.blit(rotated_ai, rot_rect)
+        # The rotated surface is new each frame, so its centre is clipped
+        # to the dial in place rather than copied out first
+        masked = rotated_ai.subsurface(pg.Rect((-rot_rect.x, -rot_rect.y), inner_ai_rect.size))
         masked.blit(self.ai_mask, (0, 0), special_flags=pg.BLEND_RGBA_MULT)
 
         surface.blit(masked, inner_ai_rect.topleft)
@@ -507,18 +616,10 @@ class CockpitRenderer:
 
         ai_centre = (C.WN_W//2, int(C.WN_H*0.89))
 
-        # The two yellow lines either side of the V-bar
-        pg.draw.line(surface, (255, 255, 0), (ai_centre[0]-35, ai_centre[1]), (ai_centre[0]-15, ai_centre[1]), 3)
-        pg.draw.line(surface, (255, 255, 0), (ai_centre[0]+35, ai_centre[1]), (ai_centre[0]+15, ai_centre[1]), 3)
-
-        # V-bar itself, draw as inverted if plane is inverted, so it always "points" in the direction of the nose
-        if not inverted:
-            pg.draw.line(surface, (255, 255, 0), ai_centre, (ai_centre[0]-10, ai_centre[1]+5), 3)
-            pg.draw.line(surface, (255, 255, 0), ai_centre, (ai_centre[0]+10, ai_centre[1]+5), 3)
-        else:
-            pg.draw.line(surface, (255, 255, 0), ai_centre, (ai_centre[0]-10, ai_centre[1]-5), 3)
-            pg.draw.line(surface, (255, 255, 0), ai_centre, (ai_centre[0]+10, ai_centre[1]-5), 3)
+        v_bar_w, v_bar_h = self.V_BAR_SURFACE_SIZE
+        surface.blit(self.v_bar_surfaces[inverted], (ai_centre[0] - v_bar_w//2, ai_centre[1] - v_bar_h//2))
 
+        if inverted:
             # Show text "INV" below the V-bar to indicate inverted flight, as it can be easy to miss otherwise
             draw_text(
                 surface, (ai_centre[0], ai_centre[1]+20), 'centre', 'centre',
@@ -55,10 +55,10 @@ class HelpScreen(PopupMenu):
 
         logical_y = top
 
-        # Make new surface with dummy large height
-        surf = pg.Surface((self.CONTENT_RECT.width, 5000), pg.SRCALPHA)
+        # Lay out every wrapped line first so the surface can be sized to fit
+        # the content exactly: (x, y, text, colour, size, font)
+        layout: list[tuple[int, int, str, Colour, int, pg.font.Font]] = []
 
-        # Fill the surf with text
         visual_styles: dict[FLine.Style, tuple[int, Colour, bool]] = {
             FLine.Style.HEADING_1: (36, (0, 192, 255), False),
             FLine.Style.HEADING_2: (28, (0, 192, 255), False),
@@ -66,31 +66,40 @@ class HelpScreen(PopupMenu):
             FLine.Style.NORMAL: (24, cols.WHITE, False),
         }
 
+        # Only a handful of sizes are used, so share one font object per size
+        fonts_by_size: dict[int, pg.font.Font] = {
+            size: pg.font.Font(self.game.assets.fonts.monospaced, size)
+            for size, _, _ in visual_styles.values()
+        }
+
         for fline in self.game.assets.texts.help_lines:
             size, colour, bullet = visual_styles[fline.style]
 
             x = left + indent_px * fline.indent
             max_w = width - indent_px * fline.indent
 
-            font = pg.font.Font(self.game.assets.fonts.monospaced, size)
+            font = fonts_by_size[size]
             if bullet:
                 bullet_prefix = "• "
                 prefix_w = font.size(bullet_prefix)[0]
                 wrapped = wrap_text(fline.text, max_w - prefix_w, font)
                 for i, line in enumerate(wrapped):
-                    render_y = logical_y
                     if i == 0:
-                        draw_text(surf, (x, render_y), 'left', 'top', bullet_prefix, colour, size, font)
-                    draw_text(surf, (x + prefix_w, render_y), 'left', 'top', line, colour, size, font)
+                        layout.append((x, logical_y, bullet_prefix, colour, size, font))
+                    layout.append((x + prefix_w, logical_y, line, colour, size, font))
                     logical_y += font.get_linesize() + 4
             else:
                 for line in wrap_text(fline.text, max_w, font):
-                    render_y = logical_y
-                    draw_text(surf, (x, render_y), 'left', 'top', line, colour, size, font)
+                    layout.append((x, logical_y, line, colour, size, font))
                     logical_y += font.get_linesize() + 4
 
             logical_y += 6  # extra spacing between FLine entries
 
+        # Fill the surf with text
+        surf = pg.Surface((self.CONTENT_RECT.width, max(1, logical_y)), pg.SRCALPHA)
+        for x, y, line, colour, size, font in layout:
+            draw_text(surf, (x, y), 'left', 'top', line, colour, size, font)
+
         surf = clamp_surf_to_non_empty(surf)
 
         return surf
@@ -32,6 +32,13 @@ class Jukebox(PopupMenu):
 
     VOLUME_INCREMENT: float = 0.1  # amount by which to change volume when pressing volume buttons
 
+    # Menu layout
+    VOLUME_DISPLAY_CENTRE_Y: int = 190
+    PROGRESS_BAR_CENTRE_Y: int = 325
+    PROGRESS_BAR_LEFT: int = 80
+    PROGRESS_BAR_W: int = 380
+    PROGRESS_BAR_H: int = 10
+
     def __init__(self, game: Game, tracks: dict[MusicID, JukeboxTrack]) -> None:
         super().__init__(game)
 
@@ -49,6 +56,7 @@ class Jukebox(PopupMenu):
         self.volume: float = 1
 
         self.surface: Surface = Surface((540, 600), flags=pg.SRCALPHA)
+        self.static_surface: Surface = self.populate_static_surface()
         self.music_channel = self.game.audio_manager.channels[SFXChannelID.MUSIC]
 
         self.track_pos_secs: float = 0.0
@@ -126,51 +134,67 @@ class Jukebox(PopupMenu):
         self.music_channel.unpause()
         self.is_playing = True
 
-    def draw(self, surface: Surface) -> None:
-        # Clear jukebox menu surface
-        self.surface.fill((0, 0, 0, 0))
-        draw_transparent_rect(self.surface, (0, 0), (540, 600), (0, 0, 0, 150), 2)
+    def populate_static_surface(self) -> Surface:
+        """Draw the parts of the menu that never change (background, title,
+        controls, labels and bar outlines) once, to avoid wasteful redraws."""
+
+        surface = Surface(self.surface.get_size(), flags=pg.SRCALPHA)
+        draw_transparent_rect(surface, (0, 0), (540, 600), (0, 0, 0, 150), 2)
 
         # Title
         draw_text(
-            self.surface, (270, 48), 'centre', 'centre',
+            surface, (270, 48), 'centre', 'centre',
             "Jukebox", cols.WHITE, 35, self.game.assets.fonts.monospaced
         )
 
-        # Show jukebox controls
+        # Show jukebox controls, batched into a single blits() call
+        controls_font = pg.font.Font(self.game.assets.fonts.monospaced, 20)
+        controls_blits: list[tuple[Surface, pg.Rect]] = []
         for i, (key, desc) in enumerate(self.game.assets.texts.controls_sections[ControlsSectionID.JUKEBOX].keys.items()):
-            draw_text(
-                self.surface, (16, 105 + 25 * i), 'left', 'centre',
-                key, cols.BLUE, 20, self.game.assets.fonts.monospaced
-            )
-            draw_text(
-                self.surface, (96, 105 + 25 * i), 'left', 'centre',
-                desc, cols.WHITE, 20, self.game.assets.fonts.monospaced
-            )
-
-        # Volume display
-        volume_display_centre_y = 190
+            key_surf = controls_font.render(key, True, cols.BLUE)
+            desc_surf = controls_font.render(desc, True, cols.WHITE)
+            controls_blits.append((key_surf, key_surf.get_rect(midleft=(16, 105 + 25 * i))))
+            controls_blits.append((desc_surf, desc_surf.get_rect(midleft=(96, 105 + 25 * i))))
+        surface.blits(controls_blits, doreturn=False)
 
+        # Volume label and bar outline
         draw_text(
-            self.surface, (16, volume_display_centre_y), 'left', 'centre',
+            surface, (16, self.VOLUME_DISPLAY_CENTRE_Y), 'left', 'centre',
             "Volume:", cols.WHITE, 20, self.game.assets.fonts.monospaced
         )
+        pg.draw.rect(surface, cols.WHITE, pg.Rect(96, self.VOLUME_DISPLAY_CENTRE_Y - 6, 380, 12), width=1)
+
+        # Currently playing label and progress bar outline
+        draw_text(
+            surface, (270, 250), 'centre', 'centre',
+            "Currently Playing", cols.WHITE, 20, self.game.assets.fonts.monospaced
+        )
+        pg.draw.rect(
+            surface, cols.WHITE,
+            pg.Rect(
+                self.PROGRESS_BAR_LEFT, self.PROGRESS_BAR_CENTRE_Y - self.PROGRESS_BAR_H // 2,
+                self.PROGRESS_BAR_W, self.PROGRESS_BAR_H
+            ),
+            width=1
+        )
+
+        return surface
+
+    def draw(self, surface: Surface) -> None:
+        # Reset jukebox menu surface to its static contents. Taking the max
+        # against the cleared surface copies pixels rather than blending them.
+        self.surface.fill((0, 0, 0, 0))
+        self.surface.blit(self.static_surface, (0, 0), special_flags=pg.BLEND_RGBA_MAX)
 
         # Volume bar
-        bar_rect = pg.Rect(96, volume_display_centre_y - 6, 380, 12)
+        volume_display_centre_y = self.VOLUME_DISPLAY_CENTRE_Y
         buffer_width = 3
-        pg.draw.rect(self.surface, cols.WHITE, bar_rect, width=1)
 
         inner_bar_width = (380 - 2 * buffer_width) * round(self.volume, ndigits=1)  # Round to 1 d.p. to avoid floating point offsets in display
         inner_bar_rect = pg.Rect(96 + buffer_width, volume_display_centre_y - 6 + buffer_width, inner_bar_width, 12 - 2 * buffer_width)
         pg.draw.rect(self.surface, cols.WHITE, inner_bar_rect)
 
         # Display currently playing song
-        draw_text(
-            self.surface, (270, 250), 'centre', 'centre',
-            "Currently Playing", cols.WHITE, 20, self.game.assets.fonts.monospaced
-        )
-
         sound_id = self.get_current_track_id()
         draw_text(
             self.surface, (270, 285), 'centre', 'centre',
@@ -178,10 +202,10 @@ class Jukebox(PopupMenu):
         )
 
         # Song progress bar
-        progress_bar_centre_y = 325
-        progress_bar_left = 80
-        progress_bar_w = 380
-        progress_bar_h = 10
+        progress_bar_centre_y = self.PROGRESS_BAR_CENTRE_Y
+        progress_bar_left = self.PROGRESS_BAR_LEFT
+        progress_bar_w = self.PROGRESS_BAR_W
+        progress_bar_h = self.PROGRESS_BAR_H
         progress_buffer = 2
 
         if self.track_length_secs > 0:
@@ -189,9 +213,6 @@ class Jukebox(PopupMenu):
         else:
             progress = 0.0  # default, prevents ZeroDivisionError
 
-        outer_rect = pg.Rect(progress_bar_left, progress_bar_centre_y - progress_bar_h // 2, progress_bar_w, progress_bar_h)
-        pg.draw.rect(self.surface, cols.WHITE, outer_rect, width=1)
-
         inner_w = int((progress_bar_w - 2 * progress_buffer) * progress)
         inner_rect = pg.Rect(
             progress_bar_left + progress_buffer,
@@ -14,7 +14,10 @@
 
 from __future__ import annotations
 
+import hashlib
 import math
+import os
+import shutil
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Callable, cast
 
@@ -32,9 +35,11 @@ from pylines.objects.buildings import (
     BuildingDefinition,
     BuildingMapIconType,
     draw_building_icon,
+    render_building_icon,
 )
 
 if TYPE_CHECKING:
+    from pylines.game.environment import ProhibitedZoneData
     from pylines.game.game import Game
     from pylines.objects.objects import Plane
     from pylines.core.asset_manager import Assets
@@ -43,11 +48,15 @@ if TYPE_CHECKING:
 class _MapRenderContext:
     display_surf: Surface
     zoom: float
+    inv_zoom: float  # map pixels per metre, precomputed to avoid repeated divisions
     view_topleft: pg.Vector2  # Vector2 allows referencing `x` and `y` attributes
     view_half_size_m: float
     map_centre: pg.Vector2
 
 class _MapSurfaceCache:
+    ROTATED_RUNWAYS_CACHE_SIZE = 256
+    SCALED_TILES_CACHE_BYTES = 32 * 1024 * 1024  # ~1 MB per tile at the largest cached size
+
     def __init__(self, game: Game) -> None:
         self.game = game  # Needs reference to assets and environment
 
@@ -56,9 +65,16 @@ class _MapSurfaceCache:
         self.scale_bar_label_cache: dict[int | float, Surface] = {}
         self.rotated_planes_cache: dict[int, Surface] = {}
         self.runway_info_cache: dict[int, Surface] = {}
+        self.runway_name_cache: dict[int, Surface] = {}
+        self.zone_label_cache: dict[str, Surface] = {}  # zone code, surface
 
         # Dynamic caches that may change during runtime
         self.grid_cache: Surface = pg.Surface((C.MAP_OVERLAY_SIZE, C.MAP_OVERLAY_SIZE), flags=pg.SRCALPHA)
+        self.rotated_runways_cache: dict[tuple[int, int, float], Surface] = {}  # (width, length, heading), surface
+        self.scaled_tiles_cache: dict[tuple[int, int], Surface] = {}  # (tile x, tile z), surface
+        self.scaled_tiles_scale: tuple[int, int, int] | None = None  # (level, width, height) the tiles were scaled at
+        self.building_icons_cache: dict[str, tuple[Surface, int]] = {}  # building type, (icon, centre offset)
+        self.building_icons_zoom: float | None = None  # zoom bucket the icons were rendered at
 
         self.populate_static_caches()
 
@@ -85,7 +101,7 @@ class _MapSurfaceCache:
         self._populate_ni_cache()
 
         # Rotated plane icon caches
-        INTERVAL = 10  # degrees
+        INTERVAL = 1  # degrees
         for yaw in range(0, 360, INTERVAL):
             # Use get_rect(center=(i, j)) when blitting rotated
             # images or else they will appear to shift
@@ -107,6 +123,77 @@ class _MapSurfaceCache:
             draw_text(info_surf, (INFO_SURF_SIZE // 2, INFO_SURF_SIZE // 2 - 50), 'centre', 'centre', runway.name, cols.WHITE, 20, self.game.assets.fonts.monospaced)
             draw_text(info_surf, (INFO_SURF_SIZE // 2, INFO_SURF_SIZE // 2 - 30), 'centre', 'centre', info_text, cols.WHITE, 15, self.game.assets.fonts.monospaced)
             self.runway_info_cache[i] = info_surf
+            self.runway_name_cache[i] = font_obj.render(runway.name, True, cols.WHITE)
+
+        # Prohibited zone code labels
+        for zone in self.game.env.prohibited_zones:
+            self.zone_label_cache[zone.code] = font_obj.render(zone.code, True, cols.MAP_PROHIBITED_TEXT_COLOUR)
+
+    def get_rotated_runway(self, width: int, length: int, heading: float) -> Surface:
+        """Return a filled runway rectangle of the given map size, rotated to
+        `heading`. Results are cached as runways only change size on zoom."""
+
+        key = (width, length, heading)
+        surf = self.rotated_runways_cache.pop(key, None)
+
+        if surf is None:
+            # Base surface length (l) aligns with the Y-axis when unrotated
+            base = Surface((width, length), pg.SRCALPHA)
+            base.fill(cols.MAP_RUNWAY_COLOUR)
+            surf = pg.transform.rotate(base, -heading)
+
+            if len(self.rotated_runways_cache) >= self.ROTATED_RUNWAYS_CACHE_SIZE:
+                # Evict least recently used entry
+                del self.rotated_runways_cache[next(iter(self.rotated_runways_cache))]
+
+        # Re-insert to mark as most recently used
+        self.rotated_runways_cache[key] = surf
+        return surf
+
+    def get_scaled_tile(self, tile_x: int, tile_z: int, level: int, tile: Surface, size: tuple[int, int]) -> Surface:
+        """Return a whole map tile scaled to `size`. Tiles keep the same
+        on-screen size while the zoom is unchanged, so panning reuses them."""
+
+        # Tiles scaled for another zoom won't be drawn again until the zoom
+        # returns to it, so they're dropped rather than left to age out
+        scale = (level, *size)
+        if scale != self.scaled_tiles_scale:
+            self.scaled_tiles_cache.clear()
+            self.scaled_tiles_scale = scale
+
+        key = (tile_x, tile_z)
+        surf = self.scaled_tiles_cache.pop(key, None)
+
+        if surf is None:
+            surf = pg.transform.scale(tile, size)
+
+            # Every cached tile is the same size, so the byte budget is a count
+            max_entries = max(1, self.SCALED_TILES_CACHE_BYTES // (surf.get_pitch() * size[1]))
+            if len(self.scaled_tiles_cache) >= max_entries:
+                # Evict least recently used entry
+                del self.scaled_tiles_cache[next(iter(self.scaled_tiles_cache))]
+
+        # Re-insert to mark as most recently used
+        self.scaled_tiles_cache[key] = surf
+        return surf
+
+    def get_building_icon(self, type_: str, zoom: float) -> tuple[Surface, int]:
+        """Return the pre-rendered map icon for a building type at `zoom`.
+        Zoom is bucketed so small zoom changes reuse the same icons."""
+
+        assert self.game.env is not None
+
+        zoom_bucket = round(zoom, 1)
+        if zoom_bucket != self.building_icons_zoom:
+            self.building_icons_cache.clear()
+            self.building_icons_zoom = zoom_bucket
+
+        icon = self.building_icons_cache.get(type_)
+        if icon is None:
+            icon = render_building_icon(self.game.env.building_defs[type_].appearance, zoom_bucket)
+            self.building_icons_cache[type_] = icon
+
+        return icon
 
 class MapMenu(PopupMenu):
     def __init__(self, game: Game, plane: Plane) -> None:
@@ -114,25 +201,33 @@ class MapMenu(PopupMenu):
 
         self._surface_cache = _MapSurfaceCache(self.game)
         self.plane = plane
-        self.viewport_pos: pg.Vector3 = self.plane.pos.copy()
+        self._viewport_pos: pg.Vector3 = self.plane.pos.copy()  # Only used once the user pans
         self.viewport_auto_panning: bool = True
 
         # Cached surface
         self.surface: Surface = Surface((C.MAP_OVERLAY_SIZE, C.MAP_OVERLAY_SIZE), pg.SRCALPHA)
 
+        # Copy of everything on the map that only depends on the view:
+        # terrain, buildings, runways, zones and the grid
+        self.static_layer = Surface((C.MAP_OVERLAY_SIZE, C.MAP_OVERLAY_SIZE))
+        self.static_layer_key: tuple | None = None
+
         # Surface to which to draw prohibited zones before blitting to a main HUD surface
         self.zone_overlay = Surface((C.MAP_OVERLAY_SIZE, C.MAP_OVERLAY_SIZE), pg.SRCALPHA)
         self.zone_overlay.fill((0, 0, 0, 0))
 
-        # Grid for advanced map info
-        self.grid_surface = Surface((C.MAP_OVERLAY_SIZE, C.MAP_OVERLAY_SIZE), pg.SRCALPHA)
-        self.grid_surface.fill((0, 0, 0, 0))
+        # One major cell of the advanced info grid, tiled across the map
+        self.grid_tile: Surface | None = None
+        self.grid_tile_key: tuple[int, float] | None = None  # grid interval and zoom the tile was drawn for
 
         # Cache numeric grid labels to avoid wasteful text redraws
         self.grid_labels_x: dict[int, Surface] = {}  # value, surface
         self.grid_labels_y: dict[int, Surface] = {}  # value, surface
         self.grid_detail_level: int | None = None
 
+        # Font shared by grid labels and the height tooltip
+        self.label_font = pg.font.Font(self.game.assets.fonts.monospaced, 18)
+
         self.build()
 
     def generate_building_legend(self) -> Surface:
@@ -188,28 +283,28 @@ class MapMenu(PopupMenu):
     def build(self):
         assert self.game.env is not None
 
+        THRESHOLDS: list[tuple[float, Colour]] = [
+            (6000, (177, 192, 204)),
+            (5500, (113, 122, 130)),
+            (5000, (79, 79, 79)),
+            (4000, (38, 38, 38)),
+            (2200, (94, 61, 39)),
+            (800,  (10, 99, 5)),
+            (150,  (23, 143, 49)),
+            (0,    (224, 207, 162)),
+            (-0.01,(84, 156, 240)),
+            (-200, (43, 118, 204)),
+            (-500, (37, 59, 179)),
+            (-1_000, (18, 36, 130)),
+            (-4_000, (7, 18, 74))
+        ]
+
+        # Sort descending by threshold
+        THRESHOLDS.sort(reverse=True, key=lambda t: t[0])
+
         def height_to_colour(h: float) -> Colour:
             lerp_colour: Callable = cols.lerp_colours
 
-            THRESHOLDS: list[tuple[float, Colour]] = [
-                (6000, (177, 192, 204)),
-                (5500, (113, 122, 130)),
-                (5000, (79, 79, 79)),
-                (4000, (38, 38, 38)),
-                (2200, (94, 61, 39)),
-                (800,  (10, 99, 5)),
-                (150,  (23, 143, 49)),
-                (0,    (224, 207, 162)),
-                (-0.01,(84, 156, 240)),
-                (-200, (43, 118, 204)),
-                (-500, (37, 59, 179)),
-                (-1_000, (18, 36, 130)),
-                (-4_000, (7, 18, 74))
-            ]
-
-            # Sort descending by threshold
-            THRESHOLDS.sort(reverse=True, key=lambda t: t[0])
-
             # Below the lowest threshold
             if h <= THRESHOLDS[-1][0]:
                 return THRESHOLDS[-1][1]
@@ -227,95 +322,88 @@ class MapMenu(PopupMenu):
 
         self.map_height_to_colour = height_to_colour
 
-        # Precompute height-colour relationship to avoid wasteful function calls
-        HEIGHT_COLOUR_LOOKUP = [height_to_colour(h) for h in range(-4_000, 6_001)]
+        # Precompute height-colour relationship to avoid wasteful function
+        # calls, interpolating each channel across all heights at once
+        threshold_hs = np.array([h for h, _ in reversed(THRESHOLDS)], dtype=np.float64)  # ascending
+        threshold_cs = np.array([c for _, c in reversed(THRESHOLDS)], dtype=np.float64)  # (13, 3)
+        lookup_hs = np.arange(-4_000, 6_001, dtype=np.float64)
+
+        HEIGHT_COLOUR_LOOKUP = np.stack(
+            [np.interp(lookup_hs, threshold_hs, threshold_cs[:, channel]) for channel in range(3)], axis=1
+        ).astype(np.uint8)  # (10001, 3), indexed by height + 4000
 
         NUM_TILES = math.ceil(C.HALF_WORLD_SIZE*2 / (C.METRES_PER_TILE))
         self.map_tiles: list[list[Surface]] = []
 
-        # Make cache directory if it doesn't exist
-        cache_dir = DIRS.cache / "map_tiles"
-        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Colours for the whole map, in surfarray (x, z) layout, so tiles
+        # are slices of one array instead of one cached image per tile
+        N = C.MAP_PIXELS_PER_TILE
+        map_size = NUM_TILES * N
+        # The colours follow entirely from the terrain and the colour scheme,
+        # so the cache file is named after a hash of both. Editing either
+        # makes a new file rather than loading a stale map.
+        world_data = self.game.assets.world
+        cache_key = hashlib.blake2b(digest_size=8)
+        cache_key.update(np.ascontiguousarray(world_data.height_array).tobytes())
+        cache_key.update(np.array([world_data.MIN_H, world_data.MAX_H, map_size], dtype=np.float64).tobytes())
+        cache_key.update(HEIGHT_COLOUR_LOOKUP.tobytes())
+        cached_map_path = DIRS.cache / f"map_colours-{cache_key.hexdigest()}.npy"
+        DIRS.cache.mkdir(parents=True, exist_ok=True)
+
+        map_colours: np.ndarray | None = None
+        if cached_map_path.exists():
+            # Load the cached numpy array to save time on startup
+            map_colours = np.load(cached_map_path, mmap_mode='r')
+
+        if map_colours is None:
+            map_colours = np.empty((map_size, map_size, 3), dtype=np.uint8)
+            xs = -C.HALF_WORLD_SIZE + np.arange(map_size, dtype=np.float64) * C.MAP_METRES_PER_PX
+
+            # Sample a full row of tiles from the heightmap per pass
+            for tile_z in range(NUM_TILES):
+                tile_start_z = -C.HALF_WORLD_SIZE + C.METRES_PER_TILE * tile_z
+                zs = tile_start_z + np.arange(N, dtype=np.float64) * C.MAP_METRES_PER_PX
+                world_x, world_z = np.meshgrid(xs, zs, indexing='ij')
+
+                heights = self.game.env.heights_at(world_x, world_z)
+                idx = np.clip(heights, -4_000, 6_000).astype(np.int32) + 4_000
+                map_colours[:, tile_z*N:(tile_z+1)*N] = HEIGHT_COLOUR_LOOKUP[idx]
+
+            # Written under a temporary name and moved into place, so a write
+            # cut short never leaves a truncated file under the final name
+            partial_map_path = cached_map_path.with_suffix(".npy.partial")
+            with open(partial_map_path, "wb") as f:
+                np.save(f, map_colours)
+            os.replace(partial_map_path, cached_map_path)
+
+            # The per-tile PNG cache this replaced is no longer read
+            shutil.rmtree(DIRS.cache / "map_tiles", ignore_errors=True)
+
+            # Clear out caches made from older terrain or colours, and any
+            # partial writes of them
+            for stale_path in DIRS.cache.glob("map_colours*"):
+                if stale_path != cached_map_path:
+                    stale_path.unlink(missing_ok=True)
 
         # Loop over tiles
         for tile_z in range(NUM_TILES):
             tile_row: list[Surface] = []
             for tile_x in range(NUM_TILES):
-                tile_filename = f"tile_{tile_x}_{tile_z}.png"
-                tile_cache_path = cache_dir / tile_filename
-
-                if tile_cache_path.exists():
-                    current_tile = pg.image.load(str(tile_cache_path)).convert()
-                    tile_row.append(current_tile)
-                    continue
-
-                tile_start_x = -C.HALF_WORLD_SIZE + C.METRES_PER_TILE * tile_x
-                tile_start_z = -C.HALF_WORLD_SIZE + C.METRES_PER_TILE * tile_z
-
                 # Make a new Surface for each tile
-                current_tile = Surface((C.MAP_PIXELS_PER_TILE, C.MAP_PIXELS_PER_TILE)).convert()
-
-                # Vectorized tile sampling from heightmap
-                env = self.game.env
-                height_arr = env.height_array
-                hmap_h, hmap_w = height_arr.shape
-
-                xs = tile_start_x + np.arange(C.MAP_PIXELS_PER_TILE, dtype=np.float32) * C.MAP_METRES_PER_PX
-                zs = tile_start_z + np.arange(C.MAP_PIXELS_PER_TILE, dtype=np.float32) * C.MAP_METRES_PER_PX
-
-                ix = (xs + C.HALF_WORLD_SIZE) / (2 * C.HALF_WORLD_SIZE) * hmap_w
-                iz = (zs + C.HALF_WORLD_SIZE) / (2 * C.HALF_WORLD_SIZE) * hmap_h
-
-                ix_grid, iz_grid = np.meshgrid(ix, iz, indexing='xy')
-                ix_grid = np.clip(ix_grid, 0, hmap_w - (1 + C.MATH_EPSILON))
-                iz_grid = np.clip(iz_grid, 0, hmap_h - (1 + C.MATH_EPSILON))
-
-                x1 = ix_grid.astype(np.int32)
-                y1 = iz_grid.astype(np.int32)
-                x2 = np.clip(x1 + 1, 0, hmap_w - 1)
-                y2 = np.clip(y1 + 1, 0, hmap_h - 1)
-
-                fx = ix_grid - x1
-                fy = iz_grid - y1
-
-                h00 = height_arr[y1, x1]
-                h10 = height_arr[y1, x2]
-                h01 = height_arr[y2, x1]
-                h11 = height_arr[y2, x2]
-
-                if env.diagonal_split == 'AD':
-                    mask = fy < fx
-                    u = np.where(mask, 1 - fx, 1 - fy)
-                    v = np.where(mask, fx - fy, fy - fx)
-                    w = np.where(mask, fy, fx)
-                    interp = np.where(
-                        mask,
-                        u * h00 + v * h10 + w * h11,
-                        u * h00 + v * h01 + w * h11
-                    )
-                else:
-                    mask = (1 - fx) > fy
-                    u = np.where(mask, 1 - fx - fy, 1 - fy)
-                    v = np.where(mask, fx, 1 - fx)
-                    w = np.where(mask, fy, fx + fy - 1)
-                    interp = u * h00 + v * h10 + w * h01
-
-                raw_height = env.min_h + (interp / 65535.0) * (env.max_h - env.min_h)
-                idx = np.clip(raw_height, -4_000, 6_000).astype(np.int32) + 4_000
-
-                lookup = np.asarray(HEIGHT_COLOUR_LOOKUP, dtype=np.uint8)
-                colours = lookup[idx]
-
-                pixels = pg.surfarray.pixels3d(current_tile)
-                pixels[:] = colours.swapaxes(0, 1)
-                del pixels
-                pg.image.save(current_tile, str(tile_cache_path))
-
+                current_tile = Surface((N, N)).convert()
+                pg.surfarray.blit_array(current_tile, map_colours[tile_x*N:(tile_x+1)*N, tile_z*N:(tile_z+1)*N])
                 tile_row.append(current_tile)
             self.map_tiles.append(tile_row)
 
+        # Pre-scaled copies of each tile at halving resolutions, so zoomed
+        # out views can sample a level close to 1:1 instead of downscaling
+        # the full-resolution tile every frame
+        self.map_tile_pyramids: list[list[list[Surface]]] = [
+            [self._build_tile_pyramid(tile) for tile in tile_row]
+            for tile_row in self.map_tiles
+        ]
+
         self.viewport_zoom: float = 50  # metres per pixel of map shown
-        self.viewport_pos = pg.Vector3(self.plane.pos)
         self.viewport_auto_panning = True
 
         # Height key setup
@@ -323,84 +411,132 @@ class MapMenu(PopupMenu):
         self.HEIGHT_KEY_H = 280
         self.height_key: Surface = Surface((self.HEIGHT_KEY_W, self.HEIGHT_KEY_H))
 
-        for i in range(self.HEIGHT_KEY_H):
-            # i goes from 0 (top) to self.HEIGHT_KEY_H - 1 (bottom)
-            # We want h to go from 6_000 (top) to -4_000 (bottom)
-            h = 6_000 - (10_000 * i / (self.HEIGHT_KEY_H - 1))
-            pg.draw.rect(self.height_key, HEIGHT_COLOUR_LOOKUP[int(h+4000)], pg.Rect(0, i, self.HEIGHT_KEY_W, 1))
+        # Rows go from 6_000 m (top) to -4_000 m (bottom)
+        key_heights = 6_000 - (10_000 * np.arange(self.HEIGHT_KEY_H) / (self.HEIGHT_KEY_H - 1))
+        key_colours = HEIGHT_COLOUR_LOOKUP[(key_heights + 4000).astype(np.int32)]  # (H, 3)
+        pg.surfarray.blit_array(self.height_key, np.repeat(key_colours[np.newaxis], self.HEIGHT_KEY_W, axis=0))
+
+        # Zone extents in world space never change, so only the
+        # viewport transform needs redoing each frame
+        self.zone_world_rects: list[tuple[float, float, float, float, ProhibitedZoneData]] = [
+            (zone.pos[0] - zone.dims[0] / 2, zone.pos[1] - zone.dims[1] / 2, zone.dims[0], zone.dims[1], zone)
+            for zone in self.game.env.prohibited_zones
+        ]
 
         self.building_legend_surface = self.generate_building_legend()
         self.height_legend_surface = self.generate_height_legend()
 
+    @staticmethod
+    def _build_tile_pyramid(tile: Surface) -> list[Surface]:
+        """Return `tile` followed by successively half-sized copies, enough
+        to cover the furthest zoom level."""
+
+        num_levels = max(1, math.ceil(math.log2(C.MAP_ZOOM_MAX / C.MAP_METRES_PER_PX)) + 1)
+
+        pyramid = [tile]
+        for _ in range(num_levels - 1):
+            w, h = pyramid[-1].get_size()
+            if w < 2 or h < 2:
+                break
+            pyramid.append(pg.transform.smoothscale(pyramid[-1], (w // 2, h // 2)))
+
+        return pyramid
+
     def _draw_base(self, ctx: _MapRenderContext) -> None:
         # Clear surface to black first
         self.surface.fill((0, 0, 0, 255))
 
-    def _draw_tiles(self, ctx: _MapRenderContext) -> None:
+    @staticmethod
+    def _visible_tile_spans(
+            view_min: float, view_max: float, tile_px: int, inv_zoom: float
+        ) -> tuple[list[int], list[int], list[int], list[float], list[float]]:
+        """Vectorised viewport/tile intersection along one axis.
+
+        The clipping maths is separable, so it only needs doing once per
+        column and once per row rather than once per tile. Returns the
+        visible tile indices with their source pixel start/length and
+        destination start/length on the map surface."""
+
         NUM_TILES = math.ceil(C.HALF_WORLD_SIZE*2 / (C.METRES_PER_TILE))
 
-        # Tile indices for the visible area
-        start_tile_x = int((ctx.view_topleft.x + C.HALF_WORLD_SIZE) / C.METRES_PER_TILE)
-        start_tile_z = int((ctx.view_topleft.y + C.HALF_WORLD_SIZE) / C.METRES_PER_TILE)
-        end_tile_x = int((ctx.view_topleft.x + 2 * ctx.view_half_size_m + C.HALF_WORLD_SIZE) / C.METRES_PER_TILE)
-        end_tile_z = int((ctx.view_topleft.y + 2 * ctx.view_half_size_m + C.HALF_WORLD_SIZE) / C.METRES_PER_TILE)
+        start_tile = int((view_min + C.HALF_WORLD_SIZE) / C.METRES_PER_TILE)
+        end_tile = int((view_max + C.HALF_WORLD_SIZE) / C.METRES_PER_TILE)
+        tiles = np.arange(max(start_tile, 0), min(end_tile, NUM_TILES - 1) + 1)
 
-        # Draw tiles
-        for tile_z in range(start_tile_z, end_tile_z + 1):
-            for tile_x in range(start_tile_x, end_tile_x + 1):
-                if not (0 <= tile_x < NUM_TILES and 0 <= tile_z < NUM_TILES):
-                    continue
+        px_per_m = tile_px / C.METRES_PER_TILE
 
-                tile_surface = self.map_tiles[tile_z][tile_x]
+        tile_world = -C.HALF_WORLD_SIZE + tiles * C.METRES_PER_TILE
+        inter_min = np.maximum(tile_world, view_min)
+        inter_max = np.minimum(tile_world + C.METRES_PER_TILE, view_max)
 
-                tile_world_x = -C.HALF_WORLD_SIZE + tile_x * C.METRES_PER_TILE
-                tile_world_z = -C.HALF_WORLD_SIZE + tile_z * C.METRES_PER_TILE
-                tile_world_x2 = tile_world_x + C.METRES_PER_TILE
-                tile_world_z2 = tile_world_z + C.METRES_PER_TILE
+        src = (inter_min - tile_world) * px_per_m
+        src_len = (inter_max - inter_min) * px_per_m
 
-                inter_left = max(tile_world_x, ctx.view_topleft.x)
-                inter_top = max(tile_world_z, ctx.view_topleft.y)
-                inter_right = min(tile_world_x2, ctx.view_topleft.x + 2 * ctx.view_half_size_m)
-                inter_bottom = min(tile_world_z2, ctx.view_topleft.y + 2 * ctx.view_half_size_m)
+        src_min = np.clip(np.floor(src), 0, tile_px).astype(np.int64)
+        src_max = np.clip(np.ceil(src + src_len), 0, tile_px).astype(np.int64)
 
-                if inter_left >= inter_right or inter_top >= inter_bottom:
-                    continue
+        visible = (inter_min < inter_max) & (src_min < src_max)
+        tiles, tile_world, src_min, src_max = tiles[visible], tile_world[visible], src_min[visible], src_max[visible]
+
+        dest = (tile_world + src_min / px_per_m - view_min) * inv_zoom
+        dest_len = ((src_max - src_min) / px_per_m) * inv_zoom
 
-                px_per_m = tile_surface.get_width() / C.METRES_PER_TILE
-                src_x = (inter_left - tile_world_x) * px_per_m
-                src_y = (inter_top - tile_world_z) * px_per_m
-                src_w = (inter_right - inter_left) * px_per_m
-                src_h = (inter_bottom - inter_top) * px_per_m
+        return tiles.tolist(), src_min.tolist(), (src_max - src_min).tolist(), dest.tolist(), dest_len.tolist()
 
-                dest_x = (inter_left - ctx.view_topleft.x) / self.viewport_zoom
-                dest_y = (inter_top - ctx.view_topleft.y) / self.viewport_zoom
-                dest_w = (inter_right - inter_left) / self.viewport_zoom
-                dest_h = (inter_bottom - inter_top) / self.viewport_zoom
+    def _draw_tiles(self, ctx: _MapRenderContext) -> None:
+        # Pick the pyramid level whose resolution is closest to (but not
+        # below) the on-screen resolution. All tiles share the same pyramid
+        # layout, so the first tile stands in for the rest.
+        pyramid_levels = len(self.map_tile_pyramids[0][0])
+        level = min(max(0, int(math.log2(self.viewport_zoom / C.MAP_METRES_PER_PX))), pyramid_levels - 1)
+        tile_px = self.map_tile_pyramids[0][0][level].get_width()
+
+        view_size = 2 * ctx.view_half_size_m
+        col_spans = self._visible_tile_spans(ctx.view_topleft.x, ctx.view_topleft.x + view_size, tile_px, ctx.inv_zoom)
+        row_spans = self._visible_tile_spans(ctx.view_topleft.y, ctx.view_topleft.y + view_size, tile_px, ctx.inv_zoom)
+
+        tile_size_on_screen = C.METRES_PER_TILE * ctx.inv_zoom
+
+        if tile_size_on_screen == tile_px:
+            # The zoom lands exactly on a pyramid level, so tiles are shown
+            # at their own resolution and need no scaling at all. Placing
+            # them from one integer origin keeps neighbours exactly abutting.
+            origin_x = math.floor((-C.HALF_WORLD_SIZE - ctx.view_topleft.x) * ctx.inv_zoom)
+            origin_y = math.floor((-C.HALF_WORLD_SIZE - ctx.view_topleft.y) * ctx.inv_zoom)
+            self.surface.blits([
+                (self.map_tile_pyramids[tile_z][tile_x][level], (origin_x + tile_x * tile_px, origin_y + tile_z * tile_px))
+                for tile_z in row_spans[0]
+                for tile_x in col_spans[0]
+            ], doreturn=False)
+            return
 
-                src_left = int(math.floor(src_x))
-                src_top = int(math.floor(src_y))
-                src_right = int(math.ceil(src_x + src_w))
-                src_bottom = int(math.ceil(src_y + src_h))
+        # Unless zoomed right in, whole tiles are small enough to cache
+        # scaled and let the map surface clip them, so no tile needs
+        # rescaling until the zoom changes
+        use_whole_tiles = tile_size_on_screen <= C.MAP_OVERLAY_SIZE
+        whole_tile_size = (max(1, int(tile_size_on_screen) + 1),) * 2
 
-                src_left = max(0, min(src_left, tile_surface.get_width()))
-                src_top = max(0, min(src_top, tile_surface.get_height()))
-                src_right = max(0, min(src_right, tile_surface.get_width()))
-                src_bottom = max(0, min(src_bottom, tile_surface.get_height()))
+        # Screen x of each visible column's left edge, shared by every row
+        col_xs = [
+            (-C.HALF_WORLD_SIZE + tile_x * C.METRES_PER_TILE - ctx.view_topleft.x) * ctx.inv_zoom
+            for tile_x in col_spans[0]
+        ]
 
-                if src_right <= src_left or src_bottom <= src_top:
-                    continue
+        # Draw tiles
+        for tile_z, src_top, src_h, dest_y, dest_h in zip(*row_spans):
+            tile_row = self.map_tile_pyramids[tile_z]
+            tile_y = (-C.HALF_WORLD_SIZE + tile_z * C.METRES_PER_TILE - ctx.view_topleft.y) * ctx.inv_zoom
 
-                src_rect = pg.Rect(src_left, src_top, src_right - src_left, src_bottom - src_top)
+            for tile_x, src_left, src_w, dest_x, dest_w, tile_x_px in zip(*col_spans, col_xs):
+                tile_surface = tile_row[tile_x][level]
 
-                world_left = tile_world_x + (src_left / px_per_m)
-                world_top = tile_world_z + (src_top / px_per_m)
-                world_w = (src_rect.w / px_per_m)
-                world_h = (src_rect.h / px_per_m)
+                if use_whole_tiles:
+                    scaled_tile = self._surface_cache.get_scaled_tile(tile_x, tile_z, level, tile_surface, whole_tile_size)
+                    self.surface.blit(scaled_tile, (tile_x_px, tile_y))
+                    continue
 
-                dest_x = (world_left - ctx.view_topleft.x) / self.viewport_zoom
-                dest_y = (world_top - ctx.view_topleft.y) / self.viewport_zoom
-                dest_w = world_w / self.viewport_zoom
-                dest_h = world_h / self.viewport_zoom
+                # Only scale the visible part of large tiles
+                src_rect = pg.Rect(src_left, src_top, src_w, src_h)
                 dest_rect = pg.Rect(dest_x, dest_y, dest_w, dest_h)
 
                 tile_crop = tile_surface.subsurface(src_rect)
@@ -412,12 +548,12 @@ class MapMenu(PopupMenu):
 
         for i, runway in enumerate(self.game.env.runways):
             # Convert runway world dimensions to map pixel dimensions, 1 pix min size
-            runway_width_map = max(1, int(runway.w / self.viewport_zoom))
-            runway_length_map = max(1, int(runway.l / self.viewport_zoom))
+            runway_width_map = max(1, int(runway.w * ctx.inv_zoom))
+            runway_length_map = max(1, int(runway.l * ctx.inv_zoom))
 
             # Calculate the runway's center position on the map_surface in pixels.
-            runway_map_center_x = (runway.pos.x - ctx.view_topleft.x) / self.viewport_zoom
-            runway_map_center_y = (runway.pos.z - ctx.view_topleft.y) / self.viewport_zoom
+            runway_map_center_x = (runway.pos.x - ctx.view_topleft.x) * ctx.inv_zoom
+            runway_map_center_y = (runway.pos.z - ctx.view_topleft.y) * ctx.inv_zoom
 
             # Skip if completely off-screen
             half_diag = 0.5 * math.hypot(runway_width_map, runway_length_map)
@@ -427,11 +563,7 @@ class MapMenu(PopupMenu):
                 or runway_map_center_y - half_diag > C.MAP_OVERLAY_SIZE):
                 continue
 
-            # Create a base surface for the runway. Its length (l) will align with the Y-axis when unrotated.
-            runway_surface_base = Surface((runway_width_map, runway_length_map), pg.SRCALPHA)
-            runway_surface_base.fill((cols.MAP_RUNWAY_COLOUR))
-
-            rotated_runway_surface = pg.transform.rotate(runway_surface_base, -runway.heading)
+            rotated_runway_surface = self._surface_cache.get_rotated_runway(runway_width_map, runway_length_map, runway.heading)
 
             # Get bounding rectangle for the rotated surface and set its center.
             runway_rect_on_map = rotated_runway_surface.get_rect(center=(runway_map_center_x, runway_map_center_y))
@@ -449,127 +581,171 @@ class MapMenu(PopupMenu):
             # Runway information
             info_surf = self._surface_cache.runway_info_cache[i]
             info_rect = info_surf.get_rect(center=(runway_cx, runway_cy))
-            draw_text(self.surface, (int(runway_cx), int(runway_cy) - 50), 'centre', 'centre', runway.name, cols.WHITE, 20, self.game.assets.fonts.monospaced)
+            name_surf = self._surface_cache.runway_name_cache[i]
+            self.surface.blit(name_surf, name_surf.get_rect(center=(int(runway_cx), int(runway_cy) - 50)))
             self.surface.blit(info_surf, info_rect)
 
     def _draw_building_icons(self, ctx: _MapRenderContext) -> None:
         assert self.game.env is not None
 
         if self.viewport_zoom < 10:  # Only show if zoomed in far enough for performance
+            # Gather visible icons and blit them all in one call
+            batch: list[tuple[Surface, tuple[int, int]]] = []
+
             for building in self.game.env.buildings:
                 # Calculate screen position for the building
-                screen_x = (building.pos.x - ctx.view_topleft[0]) / self.viewport_zoom
-                screen_y = (building.pos.z - ctx.view_topleft[1]) / self.viewport_zoom
+                screen_x = (building.pos.x - ctx.view_topleft[0]) * ctx.inv_zoom
+                screen_y = (building.pos.z - ctx.view_topleft[1]) * ctx.inv_zoom
 
                 SAFETY_BUFFER = 25  # for smoothness
                 if (-SAFETY_BUFFER < screen_x < C.MAP_OVERLAY_SIZE + SAFETY_BUFFER
                 and -SAFETY_BUFFER < screen_y < C.MAP_OVERLAY_SIZE + SAFETY_BUFFER):
-                    # Retrieve building definition
-                    def_ = self.game.env.building_defs[building.type_]
+                    icon, offset = self._surface_cache.get_building_icon(building.type_, self.viewport_zoom)
+                    batch.append((icon, (int(screen_x) - offset, int(screen_y) - offset)))
 
-                    # Draw the building icon
-                    draw_building_icon(self.surface, screen_x, screen_y, def_.appearance, self.viewport_zoom)
+            self.surface.blits(batch, doreturn=False)
 
     def _draw_prohibited_zones(self, ctx: _MapRenderContext, show_advanced_info: bool) -> None:
         assert self.game.env is not None
 
         # Draw prohibited zones
-        self.zone_overlay.fill((0, 0, 0, 0))
-        for zone in self.game.env.prohibited_zones:
-            # Calculate top-left corner in world coordinates
-            zone_top_left_wld = zone.pos[0] - zone.dims[0] / 2, zone.pos[1] - zone.dims[1] / 2
+        zone_rects = [
+            (pg.Rect(
+                (left - ctx.view_topleft.x) * ctx.inv_zoom,
+                (top - ctx.view_topleft.y) * ctx.inv_zoom,
+                w * ctx.inv_zoom,
+                h * ctx.inv_zoom
+            ), zone)
+            for left, top, w, h, zone in self.zone_world_rects
+        ]
+
+        # Only zones on the map need drawing, and only the area they and
+        # their labels cover needs clearing and compositing
+        map_rect = self.zone_overlay.get_rect()
+        zone_rects = [(zone_rect, zone) for zone_rect, zone in zone_rects if zone_rect.colliderect(map_rect)]
+        if not zone_rects:
+            return
 
-            # Calculate screen position and dimensions
-            screen_pos_x = (zone_top_left_wld[0] - ctx.view_topleft.x) / self.viewport_zoom
-            screen_pos_z = (zone_top_left_wld[1] - ctx.view_topleft.y) / self.viewport_zoom
-            screen_w = zone.dims[0] / self.viewport_zoom
-            screen_h = zone.dims[1] / self.viewport_zoom
+        labels: list[tuple[Surface, pg.Rect]] = []
+        if show_advanced_info:
+            for zone_rect, zone in zone_rects:
+                label = self._surface_cache.zone_label_cache[zone.code]
+                labels.append((label, label.get_rect(center=zone_rect.center)))
 
-            zone_rect = pg.Rect(screen_pos_x, screen_pos_z, screen_w, screen_h)
+        dirty = zone_rects[0][0].unionall([rect for rect, _ in zone_rects[1:]] + [rect for _, rect in labels])
+        dirty = dirty.clip(map_rect)
+        self.zone_overlay.fill((0, 0, 0, 0), dirty)
 
+        for zone_rect, zone in zone_rects:
             pg.draw.rect(self.zone_overlay, cols.MAP_PROHIBITED_FILL_COLOR, zone_rect)
             pg.draw.rect(self.zone_overlay, cols.MAP_PROHIBITED_BORDER_COLOR, zone_rect, width=2)  # width=2 controls border width
 
-            if show_advanced_info:
-                text_centre = (int(screen_pos_x + screen_w / 2), int(screen_pos_z + screen_h / 2))
-                draw_text(self.zone_overlay, text_centre, 'centre', 'centre', zone.code, cols.MAP_PROHIBITED_TEXT_COLOUR, 20, self.game.assets.fonts.monospaced)
-
-        self.surface.blit(self.zone_overlay, (0, 0))
+        self.zone_overlay.blits(labels, doreturn=False)
+        self.surface.blit(self.zone_overlay, dirty, dirty)
 
-    def _draw_plane_icon(self) -> None:
+    def _draw_plane_icon(self, ctx: _MapRenderContext) -> None:
         _, yaw, _ = self.plane.get_rot()
-        icon_yaw = int(round(yaw, ndigits=-1)) % 360  # using `ndigits=-1` rounds to nearest 10
+        icon_yaw = int(round(yaw)) % 360
 
         # Draw plane icon
-        cx, cz = C.MAP_OVERLAY_SIZE/2, C.MAP_OVERLAY_SIZE/2
-        icon_x = cx - (self.viewport_pos.x - self.plane.pos.x) / self.viewport_zoom
-        icon_z = cz - (self.viewport_pos.z - self.plane.pos.z) / self.viewport_zoom
+        icon_x = (self.plane.pos.x - ctx.view_topleft.x) * ctx.inv_zoom
+        icon_z = (self.plane.pos.z - ctx.view_topleft.y) * ctx.inv_zoom
 
         icon_surf = self._surface_cache.rotated_planes_cache[icon_yaw]
         icon_rect = icon_surf.get_rect(center=(icon_x, icon_z))
         self.surface.blit(icon_surf, icon_rect)
 
-    def _draw_grid(self, ctx: _MapRenderContext, minor_interval: int) -> None:
-        def world_to_map(world_x, world_z) -> tuple[float, float]:
-            screen_x = (world_x - ctx.view_topleft.x) * (1/self.viewport_zoom)
-            screen_y = (world_z - ctx.view_topleft.y) * (1/self.viewport_zoom)
-            return screen_x, screen_y
+    def _get_grid_tile(self, minor_interval: int, inv_zoom: float) -> Surface:
+        """One major grid cell of lines, for tiling across the map. The
+        grid is the same everywhere for a given spacing, so this only
+        needs redrawing when the zoom or grid interval changes."""
+
+        cache_key = (minor_interval, inv_zoom)
+        if cache_key == self.grid_tile_key and self.grid_tile is not None:
+            return self.grid_tile
+        self.grid_tile_key = cache_key
 
         GRID_MINOR_COL = (255, 255, 255, 80)
         GRID_MAJOR_COL = (255, 255, 255, 140)
+
+        minor_spacing = minor_interval * inv_zoom
+        tile_size = math.ceil(5 * minor_spacing)
+        tile = Surface((tile_size, tile_size), pg.SRCALPHA)
+        tile.fill((0, 0, 0, 0))
+
+        # Major lines run along the tile's top and left edges, drawn last
+        # so they win where they cross minor lines
+        for k in range(1, 5):
+            offset = round(k * minor_spacing)
+            pg.draw.line(tile, GRID_MINOR_COL, (offset, 0), (offset, tile_size - 1))
+            pg.draw.line(tile, GRID_MINOR_COL, (0, offset), (tile_size - 1, offset))
+        pg.draw.line(tile, GRID_MAJOR_COL, (0, 0), (0, tile_size - 1))
+        pg.draw.line(tile, GRID_MAJOR_COL, (0, 0), (tile_size - 1, 0))
+
+        self.grid_tile = tile
+        return tile
+
+    def _draw_grid(self, ctx: _MapRenderContext, minor_interval: int) -> None:
         ORIGIN_POINT_COLOUR = (0, 255, 0)
 
         major_interval = 5 * minor_interval
+        view_left, view_top, inv_zoom = ctx.view_topleft.x, ctx.view_topleft.y, ctx.inv_zoom
 
-        self.grid_surface.fill((0, 0, 0, 0))
         if self.grid_detail_level != minor_interval:  # Clear label dicts when detail level changes
             self.grid_labels_x.clear()
             self.grid_labels_y.clear()
             self.grid_detail_level = minor_interval
 
-        label_font = pg.font.Font(self.game.assets.fonts.monospaced, 18)
-
-        # Grid overlay bounds
-        start_grid_x = int(ctx.view_topleft.x // minor_interval) * minor_interval
-        end_grid_x = int((ctx.view_topleft.x + C.MAP_OVERLAY_SIZE * self.viewport_zoom) // minor_interval) * minor_interval + minor_interval
-        start_grid_z = int(ctx.view_topleft.y // minor_interval) * minor_interval
-        end_grid_z = int((ctx.view_topleft.y + C.MAP_OVERLAY_SIZE * self.viewport_zoom) // minor_interval) * minor_interval + minor_interval
-
-        # Draw grid
-        for world_x in range(start_grid_x, end_grid_x, minor_interval):
-            p1 = world_to_map(world_x, ctx.view_topleft.y)
-            p2 = world_to_map(world_x, ctx.view_topleft.y + C.MAP_OVERLAY_SIZE * self.viewport_zoom)
-            pg.draw.line(self.grid_surface, GRID_MAJOR_COL if abs(world_x % major_interval) < C.MATH_EPSILON else GRID_MINOR_COL, p1, p2, 1)
-
-            if abs(world_x % major_interval) <= C.MATH_EPSILON:
-                label_val = int(world_x)
-                label_surf = self.grid_labels_x.get(label_val)
-                if label_surf is None:
-                    label_surf = label_font.render(f"{label_val:,.0f}", True, cols.WHITE)
-                    self.grid_labels_x[label_val] = label_surf
-                label_rect = label_surf.get_rect(center=(p1[0], C.MAP_OVERLAY_SIZE - 15))
-                self.grid_surface.blit(label_surf, label_rect)
-
-        for world_z in range(start_grid_z, end_grid_z, minor_interval):
-            p1 = world_to_map(ctx.view_topleft.x, world_z)
-            p2 = world_to_map(ctx.view_topleft.x + C.MAP_OVERLAY_SIZE * self.viewport_zoom, world_z)
-            pg.draw.line(self.grid_surface, GRID_MAJOR_COL if abs(world_z % major_interval) < C.MATH_EPSILON else GRID_MINOR_COL, p1, p2, 1)
-
-            if abs(world_z % major_interval) <= C.MATH_EPSILON:
-                label_val = int(world_z)
-                label_surf = self.grid_labels_y.get(label_val)
-                if label_surf is None:
-                    label_surf = label_font.render(f"{label_val:,.0f}", True, cols.WHITE)
-                    self.grid_labels_y[label_val] = label_surf
-                label_rect = label_surf.get_rect()
-                label_rect.left = 5
-                label_rect.centery = int(p1[1])
-                self.grid_surface.blit(label_surf, label_rect)
+        label_font = self.label_font
+
+        # Major lines at or just before the view's top left, then every
+        # major interval until past the far edge
+        start_major_x = int(view_left // major_interval) * major_interval
+        start_major_z = int(view_top // major_interval) * major_interval
+        view_size = C.MAP_OVERLAY_SIZE * self.viewport_zoom
+        major_xs = list(range(start_major_x, int(view_left + view_size) + major_interval, major_interval))
+        major_zs = list(range(start_major_z, int(view_top + view_size) + major_interval, major_interval))
+        map_xs = [(world_x - view_left) * inv_zoom for world_x in major_xs]
+        map_zs = [(world_z - view_top) * inv_zoom for world_z in major_zs]
+
+        # Tile one major cell across the map. The cell's on-screen size is
+        # rarely a whole number of pixels, so each copy is placed at its
+        # rounded major line and cropped to meet the next one exactly.
+        tile = self._get_grid_tile(minor_interval, inv_zoom)
+        edges_x = [round(map_x) for map_x in map_xs]
+        edges_z = [round(map_z) for map_z in map_zs]
+        self.surface.blits([
+            (tile, (left, top), (0, 0, right - left, bottom - top))
+            for top, bottom in zip(edges_z, edges_z[1:])
+            for left, right in zip(edges_x, edges_x[1:])
+        ], doreturn=False)
+
+        # Labels for major lines, collected and blitted in one call
+        label_blits: list[tuple[Surface, pg.Rect]] = []
+
+        for label_val, map_x in zip(major_xs, map_xs):
+            label_surf = self.grid_labels_x.get(label_val)
+            if label_surf is None:
+                label_surf = label_font.render(f"{label_val:,.0f}", True, cols.WHITE)
+                self.grid_labels_x[label_val] = label_surf
+            label_blits.append((label_surf, label_surf.get_rect(center=(map_x, C.MAP_OVERLAY_SIZE - 15))))
+
+        for label_val, map_z in zip(major_zs, map_zs):
+            label_surf = self.grid_labels_y.get(label_val)
+            if label_surf is None:
+                label_surf = label_font.render(f"{label_val:,.0f}", True, cols.WHITE)
+                self.grid_labels_y[label_val] = label_surf
+            label_rect = label_surf.get_rect()
+            label_rect.left = 5
+            label_rect.centery = int(map_z)
+            label_blits.append((label_surf, label_rect))
+
+        self.surface.blits(label_blits, doreturn=False)
 
         # Draw origin
-        origin_map_x, origin_map_y = world_to_map(0, 0)
+        origin_map_x, origin_map_y = -view_left * inv_zoom, -view_top * inv_zoom
         if 0 <= origin_map_x <= C.MAP_OVERLAY_SIZE and 0 <= origin_map_y <= C.MAP_OVERLAY_SIZE:
-            pg.draw.circle(self.grid_surface, ORIGIN_POINT_COLOUR, (origin_map_x, origin_map_y), 5)
+            pg.draw.circle(self.surface, ORIGIN_POINT_COLOUR, (origin_map_x, origin_map_y), 5)
 
     def _draw_legends(self, ctx: _MapRenderContext) -> None:
         # Show building legend
@@ -584,7 +760,7 @@ class MapMenu(PopupMenu):
             (C.WN_W//2 - C.MAP_OVERLAY_SIZE//2 - 200, ctx.map_centre[1] - 180)
         )
 
-    def _draw_navigation_info(self, scale_bar_length_world: float) -> None:
+    def _draw_navigation_info(self, ctx: _MapRenderContext, scale_bar_length_world: float) -> None:
         assert self.game.env is not None
 
         # North indicator (using cached surface)
@@ -593,15 +769,15 @@ class MapMenu(PopupMenu):
 
         # Draw scale bar
         scale_bar_offset = (12, 80)
-        scale_bar_length_pix = scale_bar_length_world / self.viewport_zoom
+        scale_bar_length_pix = scale_bar_length_world * ctx.inv_zoom
         scale_bar_rect = pg.Rect(scale_bar_offset[0], scale_bar_offset[1], scale_bar_length_pix, 5)
 
         pg.draw.rect(self.surface, cols.WHITE, scale_bar_rect)
         self.surface.blit(self._surface_cache.scale_bar_label_cache[scale_bar_length_world], (scale_bar_offset[0], scale_bar_offset[1] + 10))
 
         # Calculate ground speed
-        ground_speed_vec = pg.Vector3(self.plane.vel.x, 0, self.plane.vel.z)
-        ground_speed_mag = ground_speed_vec.length()
+        vel_x, vel_z = self.plane.vel.x, self.plane.vel.z
+        ground_speed_mag = math.sqrt(vel_x * vel_x + vel_z * vel_z)
 
         draw_text(self.surface, (C.MAP_OVERLAY_SIZE//2 - 100, 30), 'left', 'centre', 'GS', (100, 255, 255), 25, self.game.assets.fonts.monospaced)
         draw_text(self.surface, (C.MAP_OVERLAY_SIZE//2 - 45, 30), 'left', 'centre', f"{units.convert_units(ground_speed_mag, units.METRES/units.SECONDS, units.KNOTS):,.0f}", cols.WHITE, 25, self.game.assets.fonts.monospaced)
@@ -609,25 +785,23 @@ class MapMenu(PopupMenu):
         # Calculate ETA
         dest_runway = self.game.env.runways[self.plane.gps_runway_index]
 
-        # Take out vertical components of relevant vectors
-        dest_pos_flat = pg.Vector3(dest_runway.pos.x, 0, dest_runway.pos.z)
-        plane_pos_flat = pg.Vector3(self.plane.pos.x, 0, self.plane.pos.z)
-        vel_flat = pg.Vector3(self.plane.vel.x, 0, self.plane.vel.z)
-
-        to_dest = dest_pos_flat - plane_pos_flat
-        distance = to_dest.length()
+        # Horizontal offset to destination (vertical components ignored)
+        dx = dest_runway.pos.x - self.plane.pos.x
+        dz = dest_runway.pos.z - self.plane.pos.z
+        distance_sq = dx * dx + dz * dz
 
-        if distance <= C.MATH_EPSILON:
+        if distance_sq <= C.MATH_EPSILON * C.MATH_EPSILON:
             # Very small distance -> already at destination
             eta_seconds = 0
         else:
-            direction = to_dest.normalize()
-            ground_speed_to_dest = vel_flat.dot(direction)
+            # Ground speed towards the destination is (v . d) / |d|, so the
+            # ETA |d| / that speed simplifies to |d|^2 / (v . d)
+            closing_dot = vel_x * dx + vel_z * dz
 
-            if ground_speed_to_dest <= C.MATH_EPSILON:
+            if closing_dot <= C.MATH_EPSILON * math.sqrt(distance_sq):
                 eta_seconds = None
             else:
-                eta_seconds = distance / ground_speed_to_dest
+                eta_seconds = distance_sq / closing_dot
 
         if eta_seconds is None:
             eta_text = "--:--"
@@ -660,10 +834,8 @@ class MapMenu(PopupMenu):
         height_m = self.game.env.get_ground_height(world_x, world_z)
         height_ft = units.convert_units(height_m, units.METRES, units.FEET)
 
-        font_size = 18
-        font = pg.font.Font(self.game.assets.fonts.monospaced, font_size)
         text = f"{height_ft:,.0f} ft"
-        text_surf = font.render(text, True, cols.WHITE)
+        text_surf = self.label_font.render(text, True, cols.WHITE)
 
         padding = 6
         box_w = text_surf.get_width() + padding * 2
@@ -683,21 +855,48 @@ class MapMenu(PopupMenu):
         )
         ctx.display_surf.blit(text_surf, (tooltip_x + padding, tooltip_y + padding))
 
-    def draw(self, surface: Surface, show_advanced_info: bool, mouse_down: bool, mouse_pos: tuple[float, float]) -> None:
-        assert self.game.env is not None
+    @property
+    def viewport_pos(self) -> pg.Vector3:
+        """Centre of the map view. Follows the plane directly while
+        auto-panning, so no copy is made every frame.
+
+        Treat this as read-only; use pan_viewport to move it."""
+
+        return self.plane.pos if self.viewport_auto_panning else self._viewport_pos
+
+    def pan_viewport(self, dx: float, dz: float) -> None:
+        """Move the map view by (dx, dz) metres, leaving auto-panning."""
 
         if self.viewport_auto_panning:
-            # Auto-update to the plane's position if auto-panning
-            self.viewport_pos = self.plane.pos.copy()
+            # Snapshot so panning doesn't move the plane itself
+            self._viewport_pos = self.plane.pos.copy()
+            self.viewport_auto_panning = False
+
+        self._viewport_pos.x += dx
+        self._viewport_pos.z += dz
+
+    def reset_viewport(self) -> None:
+        """Recentre the map view on the plane and resume following it."""
+
+        self.viewport_auto_panning = True
+
+    def draw(self, surface: Surface, show_advanced_info: bool, mouse_down: bool, mouse_pos: tuple[float, float]) -> None:
+        assert self.game.env is not None
 
         # Build context
         map_centre = pg.Vector2(C.WN_W//2, int(285 + C.WN_H * (1 - self.state.animation_open)))
         map_rect = self.surface.get_rect(center=(map_centre))
         px, _, pz = self.viewport_pos
-        viewport_half_size_m = C.MAP_OVERLAY_SIZE / 2 * self.viewport_zoom
-        view_topleft_x = px - viewport_half_size_m
-        view_topleft_z = pz - viewport_half_size_m
-        ctx = _MapRenderContext(surface, self.viewport_zoom, pg.Vector2(view_topleft_x, view_topleft_z), viewport_half_size_m, map_centre)
+        zoom, inv_zoom = self.viewport_zoom, 1 / self.viewport_zoom
+        viewport_half_size_m = C.MAP_OVERLAY_SIZE / 2 * zoom
+
+        # Snap the view to whole map pixels. Zoomed out, the plane takes
+        # many frames to cross a pixel, and until it does the static
+        # layer can be reused as-is.
+        view_topleft_px = round((px - viewport_half_size_m) * inv_zoom)
+        view_topleft_pz = round((pz - viewport_half_size_m) * inv_zoom)
+        view_topleft = pg.Vector2(view_topleft_px * zoom, view_topleft_pz * zoom)
+        ctx = _MapRenderContext(surface, zoom, inv_zoom, view_topleft, viewport_half_size_m, map_centre)
 
         # Define scale bar size here as the world length is also used in grid rendering
         target_size = self.viewport_zoom * C.MAP_MAX_SCALE_BAR_SIZE
@@ -708,22 +907,31 @@ class MapMenu(PopupMenu):
         outer_map_rect.center = (int(ctx.map_centre.x), int(ctx.map_centre.y))
         pg.draw.rect(ctx.display_surf, cols.MAP_BORDER_COLOUR, outer_map_rect)
 
-        # Draw elements
-        self._draw_base(ctx)
-        self._draw_tiles(ctx)
-        self._draw_building_icons(ctx)
-        self._draw_runways(ctx)
-        self._draw_prohibited_zones(ctx, show_advanced_info)
-        self._draw_plane_icon()
-        self._draw_navigation_info(scale_bar_length_world)
+        # Draw elements that only depend on the view, or reuse them from
+        # the last frame if it's unchanged
+        static_key = (view_topleft_px, view_topleft_pz, zoom, show_advanced_info, self.plane.gps_runway_index)
+        if static_key == self.static_layer_key:
+            self.surface.blit(self.static_layer, (0, 0))
+        else:
+            self._draw_base(ctx)
+            self._draw_tiles(ctx)
+            self._draw_building_icons(ctx)
+            self._draw_runways(ctx)
+            self._draw_prohibited_zones(ctx, show_advanced_info)
+            if show_advanced_info:
+                self._draw_grid(ctx, scale_bar_length_world)
+
+            self.static_layer.blit(self.surface, (0, 0))
+            self.static_layer_key = static_key
+
+        # Elements that can change while the view stays put
+        self._draw_plane_icon(ctx)
+        self._draw_navigation_info(ctx, scale_bar_length_world)
 
         # Show advanced info
         if show_advanced_info:
             self._draw_legends(ctx)
 
-            self._draw_grid(ctx, scale_bar_length_world)
-            self.surface.blit(self.grid_surface, (0, 0))
-
         # Show tooltip
         self._draw_tooltip(ctx, mouse_down, mouse_pos, map_rect)
 
@@ -32,9 +32,38 @@ class PopupMenuState:
     visible: bool = False
     animation_open: float = 0  # 0 = down, 1 = up
 
+    # The open/close animation is a tween from the value animation_open had
+    # when visibility last changed, recomputed from the elapsed time each
+    # step rather than accumulated, so it lands exactly on 0 or 1.
+    _animation_from: float = 0
+    _animation_target: bool = False
+    _animation_elapsed_ms: int = 0
+
     def reset(self) -> None:
         self.visible = False
         self.animation_open: float = 0
+        self._animation_from = 0
+        self._animation_target = False
+        self._animation_elapsed_ms = 0
+
+    def step_animation(self, dt: int, duration: float) -> None:
+        """Move animation_open towards 1 if visible, or 0 if hidden,
+        taking `duration` seconds for a full transition."""
+
+        if self.visible != self._animation_target:
+            self._animation_from = self.animation_open
+            self._animation_target = self.visible
+            self._animation_elapsed_ms = 0
+
+        target = 1.0 if self.visible else 0.0
+        distance = target - self._animation_from
+        if not distance:
+            return
+
+        # A reversal part-way through only has part of the distance to cover
+        self._animation_elapsed_ms += dt
+        t = self._animation_elapsed_ms / (duration * 1000 * abs(distance))
+        self.animation_open = target if t >= 1 else self._animation_from + distance * t
 
 class PopupMenu(ABC):
     def __init__(self, game: Game) -> None:
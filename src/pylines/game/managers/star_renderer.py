@@ -39,6 +39,7 @@ class StarRenderingData:
     colors: np.ndarray | None = None
     brightness: np.ndarray | None = None
     base_positions: np.ndarray | None = None
+    positions: np.ndarray | None = None  # per-frame buffer, reused to avoid reallocating
     vbo: int | None = None
     color_vbo: int | None = None
     count: int = 0
@@ -74,7 +75,10 @@ class StarRenderer:
             norms = np.linalg.norm(dirs, axis=1, keepdims=True)
             norms[norms == 0] = 1
             self.data.dirs = dirs / norms
-            self.data.colors = np.array([s.colour for s in self.env.stars], dtype=np.float32) / 255.0
+            # Colours only feed the colour VBO fill, so half precision is plenty.
+            # Directions stay float32 as float16 error at radius 1000 is
+            # around a pixel and visibly jitters constellations.
+            self.data.colors = (np.array([s.colour for s in self.env.stars], dtype=np.float32) / 255.0).astype(np.float16)
             self.data.brightness = np.array([s.brightness for s in self.env.stars], dtype=np.float32)
             self.data.count = len(self.env.stars)
 
@@ -105,12 +109,21 @@ class StarRenderer:
                 cos_theta = np.clip(np.dot(ref_dir, sun), -1.0, 1.0)
                 theta = math.acos(cos_theta)
                 sin_t = math.sin(theta)
-                v = self.data.dirs
-                rotated = (
-                    v * cos_theta +
-                    np.cross(k, v) * sin_t +
-                    k * (np.dot(v, k))[:, None] * (1 - cos_theta)
-                )
+
+                # Fold Rodrigues' formula into one 3x3 matrix so all stars
+                # are rotated by a single matmul instead of several
+                # full-size temporaries: R = I cos(t) + [k]x sin(t) + k kT (1 - cos(t))
+                k_cross = np.array([
+                    [0, -k[2], k[1]],
+                    [k[2], 0, -k[0]],
+                    [-k[1], k[0], 0],
+                ], dtype=np.float32)
+                rot_matrix = (
+                    np.eye(3, dtype=np.float32) * cos_theta +
+                    k_cross * sin_t +
+                    np.outer(k, k) * (1 - cos_theta)
+                ).astype(np.float32)
+                rotated = self.data.dirs @ rot_matrix.T
 
             norms = np.linalg.norm(rotated, axis=1, keepdims=True)
             norms[norms == 0] = 1
@@ -131,7 +144,9 @@ class StarRenderer:
             [self.plane.pos.x, self.plane.pos.y + C.CAMERA_RADIUS, self.plane.pos.z],
             dtype=np.float32,
         )
-        positions = self.data.base_positions + camera_pos
+        if self.data.positions is None or self.data.positions.shape != self.data.base_positions.shape:
+            self.data.positions = np.empty_like(self.data.base_positions)
+        positions = np.add(self.data.base_positions, camera_pos, out=self.data.positions)
 
         gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.data.vbo)
         gl.glBufferData(gl.GL_ARRAY_BUFFER, positions.nbytes, positions, gl.GL_DYNAMIC_DRAW)
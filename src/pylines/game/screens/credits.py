@@ -27,7 +27,7 @@ from pylines.core.asset_manager import (
     CreditEntryNotes,
 )
 from pylines.core.custom_types import EventList, ScancodeWrapper, Surface
-from pylines.core.utils import clamp, draw_text
+from pylines.core.utils import clamp, create_surface_texture, draw_text, upload_surface_texture
 from pylines.game.states import State, StateID
 
 if TYPE_CHECKING:
@@ -39,7 +39,7 @@ class CreditsScreen(State):
     def __init__(self, game: Game) -> None:
         super().__init__(game)
         self.display_surface = pg.Surface((C.WN_W, C.WN_H), pg.SRCALPHA)
-        self.texture_id = gl.glGenTextures(1)
+        self.texture_id = create_surface_texture(self.display_surface)
 
         self.scroll_offset = 0
         self.offset_vel = CreditsScreen.BASE_SCROLL_SPEED
@@ -195,14 +195,10 @@ class CreditsScreen(State):
             "Press Esc to exit", (110, 110, 110), 30, self.fonts.monospaced
         )
 
-        # Convert the Pygame surface to an OpenGL texture
-        texture_data = pg.image.tostring(self.display_surface, 'RGBA', True)
-
         gl.glClear(cast(int, gl.GL_COLOR_BUFFER_BIT) | cast(int, gl.GL_DEPTH_BUFFER_BIT))
-        gl.glBindTexture(gl.GL_TEXTURE_2D, self.texture_id)
-        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR)
-        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR)
-        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA, C.WN_W, C.WN_H, 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, texture_data)
+
+        # Copy the Pygame surface into its OpenGL texture
+        upload_surface_texture(self.display_surface, self.texture_id)
 
         # Set up the projection and modelview matrices for 2D drawing
         gl.glMatrixMode(gl.GL_PROJECTION)
@@ -217,13 +213,14 @@ class CreditsScreen(State):
         # Draw a full-screen quad with the texture
         gl.glEnable(gl.GL_TEXTURE_2D)
         gl.glBegin(gl.GL_QUADS)
-        gl.glTexCoord2f(0, 0)
+        # The texture's rows run top to bottom, so v is flipped against y
+        gl.glTexCoord2f(0, 1)
         gl.glVertex2f(0, 0)
-        gl.glTexCoord2f(1, 0)
-        gl.glVertex2f(C.WN_W, 0)
         gl.glTexCoord2f(1, 1)
+        gl.glVertex2f(C.WN_W, 0)
+        gl.glTexCoord2f(1, 0)
         gl.glVertex2f(C.WN_W, C.WN_H)
-        gl.glTexCoord2f(0, 1)
+        gl.glTexCoord2f(0, 0)
         gl.glVertex2f(0, C.WN_H)
         gl.glEnd()
         gl.glDisable(gl.GL_TEXTURE_2D)
@@ -16,10 +16,13 @@
 
 from __future__ import annotations
 
+import ctypes
+import math
 from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, Generator, Literal, cast
 
+import numpy as np
 import pygame as pg
 import OpenGL.GL as gl
 
@@ -38,7 +41,14 @@ from pylines.core.time_manager import (
     fetch_hour,
     sky_colour_from_hour,
 )
-from pylines.core.utils import clamp, draw_text, draw_transparent_rect, wrap_text
+from pylines.core.utils import (
+    clamp,
+    draw_text,
+    draw_transparent_rect,
+    gl_format_for_surface,
+    render_text,
+    wrap_text,
+)
 from pylines.game.managers.building_renderer import BuildingRenderer
 from pylines.game.managers.cockpit_renderer import CockpitRenderer
 from pylines.game.managers.controls_reference import ControlsReference
@@ -53,11 +63,19 @@ from pylines.objects.rotation_input_container import RotationInputContainer
 from pylines.objects.scenery.ground import Ground
 from pylines.objects.scenery.ocean import Ocean
 from pylines.objects.scenery.sky import Moon, Sky, Sun
+from pylines.shaders.shader_manager import load_shader_script
 
 if TYPE_CHECKING:
     from pylines.core.custom_types import ScancodeWrapper, Surface
     from pylines.game.game import Game
 
+# Natural logs of per-second rates, so per-frame factors are a single exp()
+_LN_MAP_ZOOM_RATE = math.log(2.5)  # map zooms by 2.5x per second
+_LN_RUDDER_RETAIN = math.log(1 - C.RUDDER_SNAPBACK)  # fraction of rudder kept after 1 s
+
+# Engine volume curve (throttle ** 1.8), sampled at 256 throttle steps
+_THROTTLE_VOLUME_LUT: tuple[float, ...] = tuple((i / 255) ** 1.8 for i in range(256))
+
 @dataclass
 class DialogMessage:
     active_time: int = 0  # milliseconds
@@ -76,6 +94,20 @@ class DialogMessage:
         self.active_time = max(self.active_time - dt, 0)
 
 class GameScreen(State):
+    # Keys handled on the frame they go down; take_input only checks these
+    HOTKEYS: tuple[int, ...] = (
+        pg.K_F5, pg.K_ESCAPE, pg.K_F1, pg.K_F2,
+        pg.K_j, pg.K_m, pg.K_o, pg.K_g, pg.K_SPACE,
+        pg.K_MINUS, pg.K_EQUALS, pg.K_LEFTBRACKET, pg.K_RIGHTBRACKET,
+    )
+
+    # Channels whose looping sounds are managed by _update_looping_sounds()
+    LOOPING_CHANNELS: tuple[SFXChannelID, ...] = (
+        SFXChannelID.WIND, SFXChannelID.ENGINE_AMBIENT, SFXChannelID.ENGINE_ACTIVE,
+        SFXChannelID.WARN_STALL, SFXChannelID.WARN_OVERSPEED,
+        SFXChannelID.TERRAIN_SCRAPE, SFXChannelID.WARN_PROHIBITED,
+    )
+
     def __init__(self, game: Game) -> None:
         """Purposefully lightweight constructor
         to avoid stalling during loading screen."""
@@ -89,6 +121,8 @@ class GameScreen(State):
         self.time_elapsed_ms: int = 0  # milliseconds
 
         self.dialog_box = DialogMessage()
+        # Looping channels started by _update_looping_sounds() and not since stopped
+        self._playing_loops: set[SFXChannelID] = set()
 
         self.sky = Sky()
         self.sun = Sun(assets.images.sun)
@@ -102,9 +136,14 @@ class GameScreen(State):
 
         # Pausing
         self.paused: bool = False
+        self.pause_overlay_surface = pg.Surface((C.WN_W, C.WN_H), pg.SRCALPHA)
+        self.pause_overlay_surface.fill((0, 0, 0, 100))
 
         # Font for text rendering
         self.font = pg.font.Font(assets.fonts.monospaced, 36)
+        self._crash_reason_surfaces: dict[CrashReason, Surface] = {}
+        self._dialog_surface: Surface | None = None
+        self._dialog_surface_key: tuple[str, Colour] | None = None
 
         # Confirmation menus
         self.in_menu_confirmation: bool = False
@@ -158,10 +197,82 @@ class GameScreen(State):
         gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T, gl.GL_CLAMP_TO_EDGE)
 
         # Allocate empty texture
-        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA, C.WN_W, C.WN_H, 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, None)
+        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA8, C.WN_W, C.WN_H, 0, gl.GL_BGRA, gl.GL_UNSIGNED_INT_8_8_8_8_REV, None)
 
         gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+
+        # Fullscreen HUD quad as interleaved (x, y, u, v) vertices.
+        # It never changes, so it lives in a static VBO.
+        hud_quad = np.array([
+            0,      0,      0, 0,
+            C.WN_W, 0,      1, 0,
+            C.WN_W, C.WN_H, 1, 1,
+            0,      C.WN_H, 0, 1,
+        ], dtype=np.float32)
+        self.hud_vbo = gl.glGenBuffers(1)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.hud_vbo)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, hud_quad.nbytes, hud_quad, gl.GL_STATIC_DRAW)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+
+        # Column-major equivalent of glOrtho(0, WN_W, WN_H, 0, -1, 1)
+        self.hud_projection = np.array([
+            [2 / C.WN_W, 0,           0,  0],
+            [0,          -2 / C.WN_H, 0,  0],
+            [0,          0,           -1, 0],
+            [-1,         1,           0,  1],
+        ], dtype=np.float32)
+
+        # The HUD quad is drawn by a pass-through shader whose uniforms
+        # never change, so they're set once here and the fixed-function
+        # matrix stack is left alone each frame
+        self.hud_shader = load_shader_script(
+            DIRS.src.shaders / "hud.vert",
+            DIRS.src.shaders / "hud.frag"
+        )
+        self.hud_pos_loc = gl.glGetAttribLocation(self.hud_shader, "position")
+        self.hud_tex_coord_loc = gl.glGetAttribLocation(self.hud_shader, "tex_coord")
+        gl.glUseProgram(self.hud_shader)
+        gl.glUniformMatrix4fv(gl.glGetUniformLocation(self.hud_shader, "u_projection"), 1, gl.GL_FALSE, self.hud_projection)
+        gl.glUniform1i(gl.glGetUniformLocation(self.hud_shader, "u_texture"), 0)
+        gl.glUseProgram(0)
+
+        # Record the quad's attribute layout once in a vertex array object
+        # where supported (GL 3.0+); otherwise it's set up on every draw
+        self.hud_vao = None
+        if gl.glGenVertexArrays:
+            self.hud_vao = gl.glGenVertexArrays(1)
+            gl.glBindVertexArray(self.hud_vao)
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.hud_vbo)
+            self._enable_hud_vertex_attributes()
+            gl.glBindVertexArray(0)
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+
         self.hud_surface = pg.Surface((C.WN_W, C.WN_H), pg.SRCALPHA)
+        # Pixel format and type to upload the HUD surface's buffer as-is (no swizzle or
+        # flip). The texture is allocated as GL_RGBA8 to match.
+        self.hud_upload_format: tuple[int, int] | None = gl_format_for_surface(self.hud_surface)
+
+        # Two pixel buffer objects, used alternately to stage HUD uploads
+        self.hud_pbos = gl.glGenBuffers(2)
+        self.hud_pbo_index: int = 0
+        self.hud_pbo_size: int = self.hud_surface.get_pitch() * C.WN_H
+        # Give both buffers their storage up front; glMapBufferRange only maps
+        # existing storage and fails on a buffer that has none
+        for pbo in self.hud_pbos:
+            gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, pbo)
+            gl.glBufferData(gl.GL_PIXEL_UNPACK_BUFFER, self.hud_pbo_size, None, gl.GL_STREAM_DRAW)
+        gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, 0)
+        # Without a direct upload format, the surface is converted to RGBA into
+        # this buffer, allocated once rather than as a new bytes object per upload
+        self.hud_rgba_buffer: np.ndarray | None = (
+            np.empty((C.WN_H, C.WN_W, 4), dtype=np.uint8)
+            if self.hud_upload_format is None else None
+        )
+        self._hud_dirty: bool = True  # HUD texture needs redrawing and re-uploading
+        # Areas of the HUD surface drawn to in the last draw_hud_surface() call
+        self._hud_dirty_rects: list[pg.Rect] = [self.hud_surface.get_rect()]
+        # Cockpit readings the HUD texture was last drawn with, or None if hidden
+        self._cockpit_display_key: tuple | None = None
 
         # Cache rotated compasses to save resources when drawing
         self.help_screen = HelpScreen(self.game)
@@ -170,6 +281,10 @@ class GameScreen(State):
         self.controls_quick_ref = ControlsReference(self.game)
         self.show_cockpit: bool = True  # Start with cockpit visible
 
+        # Brightness factor from the cloud preset, recomputed when the preset changes
+        self._cloud_attenuation: float = 1.0
+        self._cloud_attenuation_idx: int | None = None
+
         # Use the shared smoke manager so updates and draws reference the same instance.
         self.smoke_manager = self.game.smoke_manager
         self.jukebox = Jukebox(self.game, self.game.assets.sounds.jukebox_tracks)
@@ -179,6 +294,7 @@ class GameScreen(State):
         self.in_menu_confirmation = False
         self.in_restart_confirmation = False
         self.paused = False
+        self._hud_dirty = True
 
         # Reset plane
         self.plane.reset()
@@ -186,14 +302,7 @@ class GameScreen(State):
         self.smoke_manager.smoke_blobs.clear()
 
         # Reset sounds
-        self.game.audio_manager.channels[SFXChannelID.WIND].stop()
-        self.game.audio_manager.channels[SFXChannelID.ENGINE_ACTIVE].stop()
-        self.game.audio_manager.channels[SFXChannelID.ENGINE_AMBIENT].stop()
-
-        self.game.audio_manager.channels[SFXChannelID.WARN_STALL].stop()
-        self.game.audio_manager.channels[SFXChannelID.WARN_OVERSPEED].stop()
-
-        self.game.audio_manager.channels[SFXChannelID.TERRAIN_SCRAPE].stop()
+        self._stop_looping_sounds()
 
         self.sounds.jukebox_tracks[MusicID.OPEN_TWILIGHT].sound_obj.fadeout(1_500)
 
@@ -310,106 +419,182 @@ class GameScreen(State):
             'Controls', (255, 255, 255), 50, self.fonts.monospaced
         )
 
-        draw_text(self.hud_surface, (C.WN_W // 2 - 480, int(C.WN_H * 0.3)), 'left', 'centre', ControlsSectionID.MAIN, (0, 192, 255), 40, self.fonts.monospaced)
+        # Constant text is rendered once and drawn in a single batched blit
+        text_blits: list[tuple[Surface, pg.Rect]] = []
+
+        def add_text(pos: tuple[int, int], msg: str, colour: Colour, size: int) -> None:
+            text_surf = render_text(msg, colour, size, self.fonts.monospaced)
+            text_blits.append((text_surf, text_surf.get_rect(midleft=pos)))
+
+        add_text((C.WN_W // 2 - 480, int(C.WN_H * 0.3)), ControlsSectionID.MAIN, (0, 192, 255), 40)
         for i, (key, action) in enumerate(controls_sections[ControlsSectionID.MAIN].keys.items()):
-            draw_text(self.hud_surface, (C.WN_W // 2 - 480, int(C.WN_H * (0.38 + 0.04 * i))), 'left', 'centre', key, (150, 230, 255), 27, self.fonts.monospaced)
-            draw_text(self.hud_surface, (C.WN_W // 2 - 360, int(C.WN_H * (0.38 + 0.04 * i))), 'left', 'centre', action, cols.WHITE, 27, self.fonts.monospaced)
+            add_text((C.WN_W // 2 - 480, int(C.WN_H * (0.38 + 0.04 * i))), key, (150, 230, 255), 27)
+            add_text((C.WN_W // 2 - 360, int(C.WN_H * (0.38 + 0.04 * i))), action, cols.WHITE, 27)
 
-        draw_text(self.hud_surface, (C.WN_W//2 + 20, int(C.WN_H*0.26)), 'left', 'centre', ControlsSectionID.DISPLAYS, (0, 192, 255), 25, self.fonts.monospaced)
+        add_text((C.WN_W//2 + 20, int(C.WN_H*0.26)), ControlsSectionID.DISPLAYS, (0, 192, 255), 25)
         for i, (key, action) in enumerate(controls_sections[ControlsSectionID.DISPLAYS].keys.items()):
-            draw_text(self.hud_surface, (C.WN_W//2 + 20, int(C.WN_H * (0.31 + 0.03*i))), 'left', 'centre', key, (150, 230, 255), 21, self.fonts.monospaced)
-            draw_text(self.hud_surface, (C.WN_W//2 + 140, int(C.WN_H * (0.31 + 0.03*i))), 'left', 'centre', action, cols.WHITE, 21, self.fonts.monospaced)
+            add_text((C.WN_W//2 + 20, int(C.WN_H * (0.31 + 0.03*i))), key, (150, 230, 255), 21)
+            add_text((C.WN_W//2 + 140, int(C.WN_H * (0.31 + 0.03*i))), action, cols.WHITE, 21)
 
-        draw_text(self.hud_surface, (C.WN_W//2 + 20, int(C.WN_H * 0.4)), 'left', 'centre', ControlsSectionID.MAP, (0, 192, 255), 25, self.fonts.monospaced)
+        add_text((C.WN_W//2 + 20, int(C.WN_H * 0.4)), ControlsSectionID.MAP, (0, 192, 255), 25)
         for i, (key, action) in enumerate(controls_sections[ControlsSectionID.MAP].keys.items()):
-            draw_text(self.hud_surface, (C.WN_W//2 + 20, int(C.WN_H * (0.45 + 0.03 * i))), 'left', 'centre', key, (150, 230, 255), 21, self.fonts.monospaced)
-            draw_text(self.hud_surface, (C.WN_W//2 + 140, int(C.WN_H * (0.45 + 0.03 * i))), 'left', 'centre', action, cols.WHITE, 21, self.fonts.monospaced)
+            add_text((C.WN_W//2 + 20, int(C.WN_H * (0.45 + 0.03 * i))), key, (150, 230, 255), 21)
+            add_text((C.WN_W//2 + 140, int(C.WN_H * (0.45 + 0.03 * i))), action, cols.WHITE, 21)
         note = controls_sections[ControlsSectionID.MAP].note
         assert note is not None
-        draw_text(self.hud_surface, (C.WN_W//2 + 20, int(C.WN_H * (0.45 + 0.03 * (len(controls_sections[ControlsSectionID.MAP].keys) + 0.5)))), 'left', 'centre', note, (255, 255, 255), 21, self.fonts.monospaced)
+        add_text((C.WN_W//2 + 20, int(C.WN_H * (0.45 + 0.03 * (len(controls_sections[ControlsSectionID.MAP].keys) + 0.5)))), note, (255, 255, 255), 21)
 
-        draw_text(self.hud_surface, (C.WN_W//2 + 20, int(C.WN_H * 0.64)), 'left', 'centre', ControlsSectionID.UTILITIES, (0, 192, 255), 25, self.fonts.monospaced)
+        add_text((C.WN_W//2 + 20, int(C.WN_H * 0.64)), ControlsSectionID.UTILITIES, (0, 192, 255), 25)
         for i, (key, action) in enumerate(controls_sections[ControlsSectionID.UTILITIES].keys.items()):
-            draw_text(self.hud_surface, (C.WN_W//2 + 20, int(C.WN_H * (0.69 + 0.03 * i))), 'left', 'centre', key, (150, 230, 255), 21, self.fonts.monospaced)
-            draw_text(self.hud_surface, (C.WN_W//2 + 140, int(C.WN_H * (0.69 + 0.03 * i))), 'left', 'centre', action, cols.WHITE, 21, self.fonts.monospaced)
+            add_text((C.WN_W//2 + 20, int(C.WN_H * (0.69 + 0.03 * i))), key, (150, 230, 255), 21)
+            add_text((C.WN_W//2 + 140, int(C.WN_H * (0.69 + 0.03 * i))), action, cols.WHITE, 21)
+
+        self.hud_surface.blits(text_blits, doreturn=False)
+
+    def _get_dialog_surface(self) -> Surface:
+        """Return the dialog box (background and message) for the current
+        message, rebuilding it only when the message or its colour changes."""
+
+        key = (self.dialog_box.msg, self.dialog_box.colour)
+        if key == self._dialog_surface_key and self._dialog_surface is not None:
+            return self._dialog_surface
+
+        text_size = 30
+        buffer = text_size * 0.7
+        text_surf = render_text(self.dialog_box.msg, self.dialog_box.colour, text_size, self.fonts.monospaced)
+
+        # Box is sized to the rendered text rather than estimated from its length
+        dialog_surf = pg.Surface((text_surf.get_width() + 2*buffer, text_size*2.4), pg.SRCALPHA)
+        draw_transparent_rect(dialog_surf, (0, 0), dialog_surf.get_size(), (0, 0, 0, 180), 2)
+        dialog_surf.blit(text_surf, text_surf.get_rect(center=dialog_surf.get_rect().center))
+
+        self._dialog_surface_key = key
+        self._dialog_surface = dialog_surf
+        return dialog_surf
+
+    def _get_crash_reason_surface(self, reason: CrashReason) -> Surface:
+        """Return the crash banner for a crash reason, building it on first use."""
+
+        if reason in self._crash_reason_surfaces:
+            return self._crash_reason_surfaces[reason]
+
+        if reason == CrashReason.TERRAIN:
+            ui_text = "COLLISION WITH TERRAIN"
+        elif reason == CrashReason.OCEAN:
+            ui_text = "COLLISION WITH OCEAN"
+        elif reason == CrashReason.OBSTACLE:
+            ui_text = "COLLISION WITH OBSTACLE"
+        elif reason == CrashReason.RUNWAY:
+            ui_text = "IMPROPER LANDING ON RUNWAY"
+
+        # Banner is drawn in its own coordinates; it is blitted at (WN_W*0.28, WN_H*0.3)
+        banner = pg.Surface((C.WN_W*0.44, C.WN_H*0.3), pg.SRCALPHA)
+        origin_x, origin_y = int(C.WN_W*0.28), int(C.WN_H*0.3)
+        draw_transparent_rect(banner, (0, 0), banner.get_size(), (0, 0, 0, 180), 2)
+        draw_text(banner, (C.WN_W // 2 - origin_x, int(C.WN_H * 0.37) - origin_y), 'centre', 'centre', 'CRASH', (255, 0, 0), 50, self.fonts.monospaced)
+        draw_text(banner, (C.WN_W // 2 - origin_x, int(C.WN_H * 0.45) - origin_y), 'centre', 'centre', ui_text, cols.WHITE, 30, self.fonts.monospaced)
+
+        self._crash_reason_surfaces[reason] = banner
+        return banner
+
+    def _hud_has_live_content(self) -> bool:
+        """Whether anything currently shown on the HUD besides the intact
+        cockpit can change between frames."""
+
+        return (
+            self.plane.crashed
+            or self.game.diagnostics_manager.state.visible
+            or self.map_menu.state.animation_open
+            or self.jukebox.state.animation_open
+            or self.controls_quick_ref.state.animation_open
+            or self.plane.time_since_lethal_crash is not None
+            or self.time_elapsed_ms < 5_000 or not self.plane.flyable
+            or self.dialog_box.active_time > 0
+            or self.plane.crash_reason is not None
+            or self.paused
+            or self.in_menu_confirmation or self.in_restart_confirmation
+        )
 
-    def draw_hud(self):
+    def draw_hud_surface(self) -> None:
+        # Screen areas drawn to this frame. Elements whose extent isn't
+        # cheap to know claim the whole screen.
+        full_rect = self.hud_surface.get_rect()
+        dirty_rects = self._hud_dirty_rects
 
-        self.hud_surface.fill((0, 0, 0, 0))  # clear with transparency
+        # Clear with transparency. Nothing outside the areas drawn to last
+        # time can be set, so only those need clearing.
+        if full_rect in dirty_rects:
+            self.hud_surface.fill((0, 0, 0, 0))
+        else:
+            for rect in dirty_rects:
+                self.hud_surface.fill((0, 0, 0, 0), rect)
+        dirty_rects.clear()
 
         # Show cockpit if cockpit is enabled
         # Always show cockpit if the plane has crashed
         if self.show_cockpit or self.plane.crashed:
             self.cockpit_renderer.draw(self.hud_surface, self.warn_stall, self.warn_overspeed)
+            if self.plane.crashed or self.plane.damage_level > 0:
+                dirty_rects.append(full_rect)  # smoke, colour fade and damage overlays
+            else:
+                # panel_extent must cover everything draw() blends onto the
+                # surface, the rotating compass included, or those pixels are
+                # left out of the upload and the next partial clear
+                dirty_rects.append(self.cockpit_renderer.panel_extent)
+                if self.warn_stall:
+                    dirty_rects.append(self.cockpit_renderer.warning_extents["STALL"])
+                if self.warn_overspeed:
+                    dirty_rects.append(self.cockpit_renderer.warning_extents["OVERSPEED"])
 
         # Show diagnostics
-        self.game.diagnostics_manager.draw(self.hud_surface)
+        if self.game.diagnostics_manager.state.visible:
+            self.game.diagnostics_manager.draw(self.hud_surface)
+            dirty_rects.append(full_rect)
 
         # Render map
         if self.map_menu.state.animation_open:
             mouse_down = pg.mouse.get_pressed(num_buttons=3)[0]
             mouse_pos = pg.mouse.get_pos()
             self.map_menu.draw(self.hud_surface, self.map_show_advanced_info, mouse_down, mouse_pos)
+            dirty_rects.append(full_rect)
 
         # Render jukebox
         if self.jukebox.state.animation_open:
             self.jukebox.draw(self.hud_surface)
+            dirty_rects.append(full_rect)
 
         # Render controls quick reference if it's visible
         if self.controls_quick_ref.state.animation_open:
             self.controls_quick_ref.draw(self.hud_surface)
+            dirty_rects.append(full_rect)
 
-        self.cockpit_renderer.draw_crash_flash(self.hud_surface)
+        if self.plane.time_since_lethal_crash is not None:
+            self.cockpit_renderer.draw_crash_flash(self.hud_surface)
+            dirty_rects.append(full_rect)
 
         # Exit controls
         if self.time_elapsed_ms < 5_000 or not self.plane.flyable:
-            draw_text(self.hud_surface, (15, 30), 'left', 'centre', "Press Esc to pause", cols.WHITE, 30, self.fonts.monospaced)
+            text_surf = render_text("Press Esc to pause", cols.WHITE, 30, self.fonts.monospaced)
+            self.hud_surface.blit(text_surf, text_surf.get_rect(midleft=(15, 30)))
+            dirty_rects.append(pg.Rect(0, 0, C.WN_W // 2, 60))
 
         # Show dialog box
         if self.dialog_box.active_time > 0:
-            text_size = 30
-
-            text_length = len(self.dialog_box.msg)
-            text_length_pix = text_length * text_size/2
-
-            buffer = text_size * 0.7
-
-            draw_transparent_rect(
-                self.hud_surface, (C.WN_W // 2 - text_length_pix / 2 - buffer, C.WN_H * 0.2 - text_size * 1.2), (text_length_pix + 2*buffer, text_size*2.4), (0, 0, 0, 180), 2
-            )
-            draw_text(
-                self.hud_surface, (C.WN_W // 2, int(C.WN_H * 0.2)), 'centre', 'centre',
-                self.dialog_box.msg, self.dialog_box.colour, text_size, self.fonts.monospaced
-            )
-
-        def show_crash_reason(reason: CrashReason) -> None:
-            if reason == CrashReason.TERRAIN:
-                ui_text = "COLLISION WITH TERRAIN"
-            elif reason == CrashReason.OCEAN:
-                ui_text = "COLLISION WITH OCEAN"
-            elif reason == CrashReason.OBSTACLE:
-                ui_text = "COLLISION WITH OBSTACLE"
-            elif reason == CrashReason.RUNWAY:
-                ui_text = "IMPROPER LANDING ON RUNWAY"
-
-            draw_transparent_rect(
-                self.hud_surface, (C.WN_W*0.28, C.WN_H*0.3), (C.WN_W*0.44, C.WN_H*0.3),
-                (0, 0, 0, 180), 2
-            )
-            draw_text(self.hud_surface, (C.WN_W // 2, int(C.WN_H * 0.37)), 'centre', 'centre', 'CRASH', (255, 0, 0), 50, self.fonts.monospaced)
-            draw_text(self.hud_surface, (C.WN_W // 2, int(C.WN_H * 0.45)), 'centre', 'centre', ui_text, cols.WHITE, 30, self.fonts.monospaced)
+            dialog_surf = self._get_dialog_surface()
+            dialog_rect = self.hud_surface.blit(dialog_surf, dialog_surf.get_rect(center=(C.WN_W // 2, int(C.WN_H * 0.2))))
+            dirty_rects.append(dialog_rect)
 
         # Show crash reason on screen
         if self.plane.crash_reason is not None:
-            show_crash_reason(self.plane.crash_reason)
+            self.hud_surface.blit(self._get_crash_reason_surface(self.plane.crash_reason), (C.WN_W*0.28, C.WN_H*0.3))
             self.crash_screen_restart_button.draw(self.hud_surface)
+            dirty_rects.append(full_rect)
 
         # If paused, show overlay
         if self.paused:
             # Always show transparent dark overlay
-            transparent_surface = pg.Surface((C.WN_W, C.WN_H), pg.SRCALPHA)
-            transparent_surface.fill((0, 0, 0, 100))
-            self.hud_surface.blit(transparent_surface, (0, 0))
+            self.hud_surface.blit(self.pause_overlay_surface, (0, 0))
+            dirty_rects.append(full_rect)
 
             if self.in_controls_screen:
                 self.draw_controls_screen()
@@ -420,49 +605,149 @@ class GameScreen(State):
                 self.draw_pause_screen()
 
         self.draw_confirmation_menu()  # always show confirmation menu if one is active
+        if self.in_menu_confirmation or self.in_restart_confirmation:
+            dirty_rects.append(full_rect)
+
+    def _stage_hud_rows(self, top: int, bottom: int) -> None:
+        """Copy rows [top, bottom) of the HUD surface into the next pixel
+        buffer object and leave it bound, so that glTexSubImage2D reads from
+        it and the transfer to the texture happens asynchronously."""
+
+        pbo = self.hud_pbos[self.hud_pbo_index]
+        self.hud_pbo_index = 1 - self.hud_pbo_index  # alternate between the two PBOs
+
+        pitch = self.hud_surface.get_pitch()
+        offset, length = top * pitch, (bottom - top) * pitch
+
+        gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, pbo)
+        if gl.glMapBufferRange:
+            # Map just the rows being written. Invalidating the whole buffer
+            # lets the driver hand back fresh storage instead of waiting on
+            # a transfer still reading the old contents.
+            dest = gl.glMapBufferRange(
+                gl.GL_PIXEL_UNPACK_BUFFER, offset, length,
+                gl.GL_MAP_WRITE_BIT | gl.GL_MAP_INVALIDATE_BUFFER_BIT
+            )
+        else:
+            # No GL 3.0 / ARB_map_buffer_range: orphan the old storage instead
+            gl.glBufferData(gl.GL_PIXEL_UNPACK_BUFFER, self.hud_pbo_size, None, gl.GL_STREAM_DRAW)
+            dest = gl.glMapBuffer(gl.GL_PIXEL_UNPACK_BUFFER, gl.GL_WRITE_ONLY) + offset
+
+        # Rows stay top-to-bottom; the quad's texcoords account for that
+        pixels = np.frombuffer(self.hud_surface.get_view('1'), dtype=np.uint8)
+        ctypes.memmove(dest, pixels.ctypes.data + offset, length)
+        del pixels  # releases the surface lock held by the buffer view
+
+        gl.glUnmapBuffer(gl.GL_PIXEL_UNPACK_BUFFER)
+
+    def upload_hud_regions(self, regions: list[pg.Rect]) -> None:
+        """Upload only the given areas of the HUD surface to the HUD texture,
+        which must already be bound to texture unit 0."""
+
+        full_rect = self.hud_surface.get_rect()
+        if self.hud_upload_format is None or full_rect in regions:
+            regions = [full_rect]
+        elif len(regions) > 4:
+            # Many small uploads cost more than one larger one
+            regions = [regions[0].unionall(regions[1:])]
+        regions = [region.clip(full_rect) for region in regions]
+        regions = [region for region in regions if region.w and region.h]
+        if not regions:
+            return
 
-        # Upload HUD surface to OpenGL
-        hud_data = pg.image.tostring(self.hud_surface, "RGBA", True)
+        hud_data: np.ndarray | None
+        if self.hud_upload_format is not None:
+            upload_format, upload_type = self.hud_upload_format
+            # Only the rows covering the regions need staging
+            self._stage_hud_rows(min(region.top for region in regions), max(region.bottom for region in regions))
+            hud_data = None  # offset 0 into the bound PBO
+        else:
+            upload_format = gl.GL_RGBA
+            upload_type = gl.GL_UNSIGNED_BYTE
+            assert self.hud_rgba_buffer is not None
+            hud_data = self.hud_rgba_buffer
+            # The surfarray views index (x, y), so transpose them into rows
+            rgb = pg.surfarray.pixels3d(self.hud_surface)
+            alpha = pg.surfarray.pixels_alpha(self.hud_surface)
+            np.copyto(hud_data[..., :3], rgb.transpose(1, 0, 2))
+            np.copyto(hud_data[..., 3], alpha.T)
+            del rgb, alpha  # release the surface locks held by the views
+
+        gl.glPixelStorei(gl.GL_UNPACK_ROW_LENGTH, C.WN_W)
+        for region in regions:
+            gl.glPixelStorei(gl.GL_UNPACK_SKIP_PIXELS, region.x)
+            gl.glPixelStorei(gl.GL_UNPACK_SKIP_ROWS, region.y)
+            gl.glTexSubImage2D(
+                gl.GL_TEXTURE_2D, 0, region.x, region.y, region.w, region.h,
+                upload_format, upload_type, hud_data
+            )
+        gl.glPixelStorei(gl.GL_UNPACK_ROW_LENGTH, 0)
+        gl.glPixelStorei(gl.GL_UNPACK_SKIP_PIXELS, 0)
+        gl.glPixelStorei(gl.GL_UNPACK_SKIP_ROWS, 0)
 
-        gl.glEnable(gl.GL_BLEND)
-        gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
-        gl.glBindTexture(gl.GL_TEXTURE_2D, self.hud_tex)
-        gl.glTexSubImage2D(gl.GL_TEXTURE_2D, 0, 0, 0, C.WN_W, C.WN_H, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, hud_data)
-        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+        gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, 0)
 
-        gl.glDisable(gl.GL_DEPTH_TEST)
+    def _enable_hud_vertex_attributes(self) -> None:
+        """Point the HUD shader's attributes at the bound quad VBO."""
 
-        # Render HUD on top of 3D world
-        gl.glEnable(gl.GL_TEXTURE_2D)
+        stride = 4 * ctypes.sizeof(ctypes.c_float)
+        gl.glEnableVertexAttribArray(self.hud_pos_loc)
+        gl.glVertexAttribPointer(self.hud_pos_loc, 2, gl.GL_FLOAT, gl.GL_FALSE, stride, ctypes.c_void_p(0))
+        gl.glEnableVertexAttribArray(self.hud_tex_coord_loc)
+        gl.glVertexAttribPointer(self.hud_tex_coord_loc, 2, gl.GL_FLOAT, gl.GL_FALSE, stride, ctypes.c_void_p(2 * ctypes.sizeof(ctypes.c_float)))
+
+    def _disable_hud_vertex_attributes(self) -> None:
+        gl.glDisableVertexAttribArray(self.hud_pos_loc)
+        gl.glDisableVertexAttribArray(self.hud_tex_coord_loc)
+
+    def draw_hud(self):
+        # Only redraw and re-upload the HUD while something on it can change.
+        # One extra pass is made after the last live frame so the texture
+        # doesn't keep showing stale elements (e.g. a menu that just closed).
+        cockpit_key = (
+            self.cockpit_renderer.display_key(self.warn_stall, self.warn_overspeed)
+            if self.show_cockpit else None
+        )
+        cockpit_changed = cockpit_key != self._cockpit_display_key
+        self._cockpit_display_key = cockpit_key
 
+        # Bound once for both the upload and the draw, and left bound after.
+        # Every other pass binds its own textures before using them.
+        gl.glActiveTexture(gl.GL_TEXTURE0)
         gl.glBindTexture(gl.GL_TEXTURE_2D, self.hud_tex)
-        gl.glColor4f(1, 1, 1, 1)
 
-        gl.glMatrixMode(gl.GL_PROJECTION)
-        gl.glPushMatrix()
-        gl.glLoadIdentity()
-        gl.glOrtho(0, C.WN_W, C.WN_H, 0, -1, 1)
+        hud_live = cockpit_changed or self._hud_has_live_content()
+        if hud_live or self._hud_dirty:
+            prev_rects = list(self._hud_dirty_rects)
+            self.draw_hud_surface()
 
-        gl.glMatrixMode(gl.GL_MODELVIEW)
-        gl.glPushMatrix()
-        gl.glLoadIdentity()
+            # Upload what was drawn this frame plus what was drawn last
+            # frame, so areas that have since been cleared are updated too
+            self.upload_hud_regions(self._hud_dirty_rects + prev_rects)
+        self._hud_dirty = hud_live
 
-        gl.glBegin(gl.GL_QUADS)
+        gl.glEnable(gl.GL_BLEND)
+        gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
 
-        gl.glTexCoord2f(0, 1); gl.glVertex2f(0, 0)
-        gl.glTexCoord2f(1, 1); gl.glVertex2f(C.WN_W, 0)
-        gl.glTexCoord2f(1, 0); gl.glVertex2f(C.WN_W, C.WN_H)
-        gl.glTexCoord2f(0, 0); gl.glVertex2f(0, C.WN_H)
-        gl.glEnd()
+        gl.glDisable(gl.GL_DEPTH_TEST)
 
-        gl.glPopMatrix()
-        gl.glMatrixMode(gl.GL_PROJECTION)
-        gl.glPopMatrix()
-        gl.glMatrixMode(gl.GL_MODELVIEW)
+        # Render HUD on top of 3D world
+        gl.glUseProgram(self.hud_shader)
 
-        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+        # The quad's corners go round in order, so it draws as a fan
+        if self.hud_vao is not None:
+            gl.glBindVertexArray(self.hud_vao)
+            gl.glDrawArrays(gl.GL_TRIANGLE_FAN, 0, 4)
+            gl.glBindVertexArray(0)
+        else:
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.hud_vbo)
+            self._enable_hud_vertex_attributes()
+            gl.glDrawArrays(gl.GL_TRIANGLE_FAN, 0, 4)
+            self._disable_hud_vertex_attributes()
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+
+        gl.glUseProgram(0)
         gl.glEnable(gl.GL_DEPTH_TEST)
-        gl.glDisable(gl.GL_TEXTURE_2D)
 
     def update(self, dt: int):
 
@@ -480,15 +765,19 @@ class GameScreen(State):
         if self.paused:
             return
 
-        self.dialog_box.update(dt)
+        # Locals for the per-frame warning and sound updates below
+        plane = self.plane
+        dialog_box = self.dialog_box
+        dialog_box.update(dt)
 
-        if self.plane.crashed:
+        if plane.crashed:
             self.smoke_manager.update(dt)
-            self.plane.increment_crash_timer(dt)
+            plane.increment_crash_timer(dt)
 
-            self.dialog_box.reset()
+            dialog_box.reset()
 
             self.game.audio_manager.stop_all(exclude=[SFXChannelID.LANDING_SFX])
+            self._playing_loops.clear()
 
             return
 
@@ -498,86 +787,83 @@ class GameScreen(State):
                 self._auto_screenshot_pending = True
                 self._auto_screenshot_elapsed_ms %= self.auto_screenshot_interval_ms
 
-        # Jukebox menu update
-        if not self.jukebox.state.visible:
-            self.jukebox.state.animation_open -= (dt/1000) / C.JUKEBOX_MENU_TOGGLE_ANIMATION_DURATION
-        else:
-            self.jukebox.state.animation_open += (dt/1000) / C.JUKEBOX_MENU_TOGGLE_ANIMATION_DURATION
-        self.jukebox.state.animation_open = clamp(self.jukebox.state.animation_open, (0, 1))
+        # Menu open/close animations. Fully closed menus snap to exactly 0,
+        # which draw_hud_surface relies on to skip drawing them.
+        self.jukebox.state.step_animation(dt, C.JUKEBOX_MENU_TOGGLE_ANIMATION_DURATION)
+        self.map_menu.state.step_animation(dt, C.MAP_TOGGLE_ANIMATION_DURATION)
+        self.controls_quick_ref.state.step_animation(dt, C.CONTROLS_REF_TOGGLE_ANIMATION_DURATION)
+
+        channels = self.game.audio_manager.channels
+        sounds = self.sounds
+
+        plane.update(dt)
+        speed = plane.vel.length()  # m/s, used by several checks below
+
+        # Warnings
+        warn_stall = self.warn_stall = plane.stalled
+        warn_overspeed = self.warn_overspeed = speed > plane.model.v_ne  # Both in m/s
+        in_prohibited_zone = self.show_prohibited_zone_warning = plane.over_prohibited_zone()
+        if in_prohibited_zone:
+            dialog_box.set_message("Immediately exit this zone - penalties may apply", (255, 127, 0), 100)
+
+        # Looping sounds that should be playing this frame
+        desired_loops: dict[SFXChannelID, pg.mixer.Sound] = {
+            SFXChannelID.WIND: sounds.wind,
+            SFXChannelID.ENGINE_AMBIENT: sounds.engine_loop_ambient,
+            SFXChannelID.ENGINE_ACTIVE: sounds.engine_loop_active,
+        }
+        if warn_stall:
+            desired_loops[SFXChannelID.WARN_STALL] = sounds.stall_warning
+        if warn_overspeed:
+            desired_loops[SFXChannelID.WARN_OVERSPEED] = sounds.overspeed
+        if plane.on_ground and not plane.over_runway():  # Cheap check first
+            desired_loops[SFXChannelID.TERRAIN_SCRAPE] = sounds.terrain_scrape
+        if in_prohibited_zone:
+            desired_loops[SFXChannelID.WARN_PROHIBITED] = sounds.prohibited_zone_warning
+        self._update_looping_sounds(desired_loops)
+
+        # Engine and wind volumes
+        wind_sound_strength = (speed - 61.73) / 25.72  # start wind at 120 kn, full at 170
+        channels[SFXChannelID.WIND].set_volume(max(0.0, min(wind_sound_strength, 1.0)))
+
+        throttle_sound_strength = _THROTTLE_VOLUME_LUT[int(plane.throttle_frac * 255 + 0.5)]
+        channels[SFXChannelID.ENGINE_ACTIVE].set_volume(throttle_sound_strength)
 
-        # Map update
-        if not self.map_menu.state.visible:
-            self.map_menu.state.animation_open -= (dt/1000) / C.MAP_TOGGLE_ANIMATION_DURATION
-        else:
-            self.map_menu.state.animation_open += (dt/1000) / C.MAP_TOGGLE_ANIMATION_DURATION
-        self.map_menu.state.animation_open = clamp(self.map_menu.state.animation_open, (0, 1))
+        # Update BGM based on jukebox
+        self.jukebox.update(dt)
+        self.game.diagnostics_manager.update_debug_log()
 
-        # Controls ref update
-        if not self.controls_quick_ref.state.visible:
-            self.controls_quick_ref.state.animation_open -= (dt/1000) / C.CONTROLS_REF_TOGGLE_ANIMATION_DURATION
-        else:
-            self.controls_quick_ref.state.animation_open += (dt/1000) / C.CONTROLS_REF_TOGGLE_ANIMATION_DURATION
-        self.controls_quick_ref.state.animation_open = clamp(self.controls_quick_ref.state.animation_open, (0, 1))
+    def _update_looping_sounds(self, desired_loops: dict[SFXChannelID, pg.mixer.Sound]) -> None:
+        """Start and stop looping channels, touching the mixer only for
+        channels whose desired state changed since the last call."""
 
-        self.plane.update(dt)
+        channels = self.game.audio_manager.channels
+        playing_loops = self._playing_loops
 
-        # Stall warning
-        self.warn_stall = self.plane.stalled
-        if self.warn_stall:
-            if not self.game.audio_manager.channels[SFXChannelID.WARN_STALL].get_busy():
-                self.game.audio_manager.channels[SFXChannelID.WARN_STALL].play(self.sounds.stall_warning, loops=-1)
-        else:
-            self.game.audio_manager.channels[SFXChannelID.WARN_STALL].stop()
+        for channel_id in playing_loops - desired_loops.keys():
+            channels[channel_id].stop()
+        for channel_id, sound in desired_loops.items():
+            if channel_id not in playing_loops:
+                channels[channel_id].play(sound, loops=-1)
 
-        # Overspeed warning
-        self.warn_overspeed = self.plane.vel.length() > self.plane.model.v_ne  # Both in m/s
-        if self.warn_overspeed:
-            if not self.game.audio_manager.channels[SFXChannelID.WARN_OVERSPEED].get_busy():
-                self.game.audio_manager.channels[SFXChannelID.WARN_OVERSPEED].play(self.sounds.overspeed, loops=-1)
-        else:
-            self.game.audio_manager.channels[SFXChannelID.WARN_OVERSPEED].stop()
-
-        # Update engine and wind sounds
-        if not self.game.audio_manager.channels[SFXChannelID.WIND].get_busy():
-            self.game.audio_manager.channels[SFXChannelID.WIND].play(self.sounds.wind, loops=-1)
-        if not self.game.audio_manager.channels[SFXChannelID.ENGINE_AMBIENT].get_busy():
-            self.game.audio_manager.channels[SFXChannelID.ENGINE_AMBIENT].play(self.sounds.engine_loop_ambient, loops=-1)
-        if not self.game.audio_manager.channels[SFXChannelID.ENGINE_ACTIVE].get_busy():
-            self.game.audio_manager.channels[SFXChannelID.ENGINE_ACTIVE].play(self.sounds.engine_loop_active, loops=-1)
-
-        wind_sound_strength = (self.plane.vel.length() - 61.73) / 25.72  # start wind at 120 kn, full at 170
-        self.game.audio_manager.channels[SFXChannelID.WIND].set_volume(clamp(wind_sound_strength, (0, 1)))
-
-        throttle_sound_strength = self.plane.throttle_frac ** 1.8
-        self.game.audio_manager.channels[SFXChannelID.ENGINE_ACTIVE].set_volume(throttle_sound_strength)
-
-        # Terrain scrape sound
-        if (not self.plane.over_runway()) and self.plane.on_ground:
-            if not self.game.audio_manager.channels[SFXChannelID.TERRAIN_SCRAPE].get_busy():
-                self.game.audio_manager.channels[SFXChannelID.TERRAIN_SCRAPE].play(self.sounds.terrain_scrape, -1)
-        else:
-            self.game.audio_manager.channels[SFXChannelID.TERRAIN_SCRAPE].stop()
-
-        # Prohibited zone warning sound
-        self.show_prohibited_zone_warning = self.plane.over_prohibited_zone()
-        if self.show_prohibited_zone_warning:
-            if not self.game.audio_manager.channels[SFXChannelID.WARN_PROHIBITED].get_busy():
-                self.game.audio_manager.channels[SFXChannelID.WARN_PROHIBITED].play(self.sounds.prohibited_zone_warning, loops=-1)
-            self.dialog_box.set_message("Immediately exit this zone - penalties may apply", (255, 127, 0), 100)
-        else:
-            self.game.audio_manager.channels[SFXChannelID.WARN_PROHIBITED].stop()
+        self._playing_loops = set(desired_loops)
 
-        # Update BGM based on jukebox
-        self.jukebox.update(dt)
-        self.game.diagnostics_manager.update_debug_log()
+    def _stop_looping_sounds(self) -> None:
+        for channel_id in self.LOOPING_CHANNELS:
+            self.game.audio_manager.channels[channel_id].stop()
+        self._playing_loops.clear()
 
     def take_input(self, keys: ScancodeWrapper, events: EventList, dt: int) -> None:
+        # Hotkeys that went down this frame, found in a single pass
+        prev_keys = self.game.prev_keys
+        just_pressed = {key for key in self.HOTKEYS if keys[key] and not prev_keys[key]}
+
         # Screenshot - this needs to ALWAYS WORK
-        if self.pressed(keys, pg.K_F5):
+        if pg.K_F5 in just_pressed:
             self.take_screenshot()
 
         # Meta controls
-        if self.pressed(keys, pg.K_ESCAPE):
+        if pg.K_ESCAPE in just_pressed:
             if self.in_controls_screen or self.help_screen.state.visible:
                 self.in_controls_screen = False
                 self.help_screen.toggle_visibility()
@@ -596,6 +882,7 @@ class GameScreen(State):
             # Stop all channels if pause button is pressed, except music
             # Then pause the music channel
             self.game.audio_manager.stop_all(exclude=[SFXChannelID.MUSIC])
+            self._playing_loops.clear()
 
         if self.paused and not (self.in_menu_confirmation or self.in_restart_confirmation):
             if self.controls_button.check_click(events) and not self.in_controls_screen and not self.help_screen.state.visible:
@@ -643,15 +930,15 @@ class GameScreen(State):
                 self.in_restart_confirmation = False
 
         # Toggle jukebox menu
-        if self.pressed(keys, pg.K_j):
+        if pg.K_j in just_pressed:
             self.jukebox.toggle_visibility()
 
         # Cockpit visibility toggling
-        if self.pressed(keys, pg.K_F1):  # F1 to toggle HUD
+        if pg.K_F1 in just_pressed:  # F1 to toggle HUD
             self.show_cockpit = not self.show_cockpit
 
         # Diagnostics - should NOT be blocked by crashed plane
-        if self.pressed(keys, pg.K_F2):
+        if pg.K_F2 in just_pressed:
             self.game.diagnostics_manager.toggle_visibility()
 
         # Block flight controls if crashed or disabled
@@ -662,83 +949,80 @@ class GameScreen(State):
             self.update_prev_keys(keys)
             return
 
+        # Locals for the per-frame flight and map controls below
+        plane = self.plane
+        map_menu = self.map_menu
+        jukebox = self.jukebox
+        rot_inputs = plane.rot_input_container
+        dt_s = dt / 1000
+
         # Jukebox controls
-        if self.jukebox.state.visible:
-            if self.pressed(keys, pg.K_MINUS):
-                self.jukebox.volume -= self.jukebox.VOLUME_INCREMENT
-            if self.pressed(keys, pg.K_EQUALS):
-                self.jukebox.volume += self.jukebox.VOLUME_INCREMENT
-            self.jukebox.volume = clamp(self.jukebox.volume, (0, 1))
-
-            if self.pressed(keys, pg.K_LEFTBRACKET):
-                self.jukebox.prev_track()
-            if self.pressed(keys, pg.K_RIGHTBRACKET):
-                self.jukebox.next_track()
-
-            if self.pressed(keys, pg.K_SPACE):
-                if self.jukebox.is_playing:
-                    self.jukebox.pause()
+        if jukebox.state.visible:
+            if pg.K_MINUS in just_pressed:
+                jukebox.volume -= jukebox.VOLUME_INCREMENT
+            if pg.K_EQUALS in just_pressed:
+                jukebox.volume += jukebox.VOLUME_INCREMENT
+            jukebox.volume = clamp(jukebox.volume, (0, 1))
+
+            if pg.K_LEFTBRACKET in just_pressed:
+                jukebox.prev_track()
+            if pg.K_RIGHTBRACKET in just_pressed:
+                jukebox.next_track()
+
+            if pg.K_SPACE in just_pressed:
+                if jukebox.is_playing:
+                    jukebox.pause()
                 else:
-                    self.jukebox.unpause()
+                    jukebox.unpause()
 
         # Show/hide map
-        if self.pressed(keys, pg.K_m):
-            self.map_menu.toggle_visibility()
+        if pg.K_m in just_pressed:
+            map_menu.toggle_visibility()
 
         # Show/hide quick ref for controls
-        if self.pressed(keys, pg.K_o):
+        if pg.K_o in just_pressed:
             self.controls_quick_ref.toggle_visibility()
 
         # Cycle GPS waypoint
-        if self.pressed(keys, pg.K_g):
-            self.plane.cycle_gps_waypoint()
+        if pg.K_g in just_pressed:
+            plane.cycle_gps_waypoint()
 
-        if self.map_menu.state.visible:
+        if map_menu.state.visible:
             # While map is shown: control zoom
             if keys[pg.K_w]:
-                self.map_menu.viewport_zoom /= 2.5 ** (dt/1000)
+                map_menu.viewport_zoom *= math.exp(-_LN_MAP_ZOOM_RATE * dt_s)
             if keys[pg.K_s]:
-                self.map_menu.viewport_zoom *= 2.5 ** (dt/1000)
-            self.map_menu.viewport_zoom = clamp(self.map_menu.viewport_zoom, (C.MAP_ZOOM_MIN, C.MAP_ZOOM_MAX))
+                map_menu.viewport_zoom *= math.exp(_LN_MAP_ZOOM_RATE * dt_s)
+            map_menu.viewport_zoom = clamp(map_menu.viewport_zoom, (C.MAP_ZOOM_MIN, C.MAP_ZOOM_MAX))
         else:
             # Throttle controls
             if keys[pg.K_w]:
-                self.plane.throttle_frac += C.THROTTLE_SPEED * dt/1000
+                plane.throttle_frac += C.THROTTLE_SPEED * dt_s
             if keys[pg.K_s]:
-                self.plane.throttle_frac -= C.THROTTLE_SPEED * dt/1000
-            self.plane.throttle_frac = clamp(self.plane.throttle_frac, (0, 1))
+                plane.throttle_frac -= C.THROTTLE_SPEED * dt_s
+            plane.throttle_frac = clamp(plane.throttle_frac, (0, 1))
 
         # Show advanced info iff map is visible and advanced info key is held down
-        self.map_show_advanced_info = self.map_menu.state.visible and keys[pg.K_h]
+        self.map_show_advanced_info = map_menu.state.visible and keys[pg.K_h]
 
         # Turning or map panning
-        if self.map_menu.state.visible:
-            self.plane.rot_input_container.reset()  # zero out plane rotation inputs while map is shown
-            panning_speed = self.map_menu.viewport_zoom * 150
+        if map_menu.state.visible:
+            rot_inputs.reset()  # zero out plane rotation inputs while map is shown
+            panning_speed = map_menu.viewport_zoom * 150
 
             # Map shown -> pan map
-            if keys[pg.K_UP]:
-                self.map_menu.viewport_pos.z -= panning_speed * dt/1000
-                self.map_menu.viewport_auto_panning = False
-            if keys[pg.K_DOWN]:
-                self.map_menu.viewport_pos.z += panning_speed * dt/1000
-                self.map_menu.viewport_auto_panning = False
-            if keys[pg.K_LEFT]:
-                self.map_menu.viewport_pos.x -= panning_speed * dt/1000
-                self.map_menu.viewport_auto_panning = False
-            if keys[pg.K_RIGHT]:
-                self.map_menu.viewport_pos.x += panning_speed * dt/1000
-                self.map_menu.viewport_auto_panning = False
+            pan_x = keys[pg.K_RIGHT] - keys[pg.K_LEFT]
+            pan_z = keys[pg.K_DOWN] - keys[pg.K_UP]
+            if keys[pg.K_UP] or keys[pg.K_DOWN] or keys[pg.K_LEFT] or keys[pg.K_RIGHT]:
+                map_menu.pan_viewport(pan_x * panning_speed * dt_s, pan_z * panning_speed * dt_s)
 
             # Reset map viewport pos
-            if self.pressed(keys, pg.K_SPACE):
-                self.map_menu.viewport_pos = self.plane.pos.copy()
-                self.map_menu.viewport_auto_panning = True
+            if pg.K_SPACE in just_pressed:
+                map_menu.reset_viewport()
         else:
             # Reset map viewport pos once map goes fully down
-            if not self.map_menu.state.animation_open:
-                self.map_menu.viewport_pos = self.plane.pos.copy()
-                self.map_menu.viewport_auto_panning = True
+            if not map_menu.state.animation_open:
+                map_menu.reset_viewport()
 
             # Pitch
             direction: Literal[-1, 1] = -1 if self.game.save_data.invert_y_axis else 1
@@ -749,7 +1033,7 @@ class GameScreen(State):
             if keys[pg.K_DOWN]:
                 pitch_input -= direction
             assert pitch_input in (-1, 0, 1)
-            self.plane.rot_input_container.pitch_input = pitch_input
+            rot_inputs.pitch_input = pitch_input
 
             # Turning
             roll_input = 0  # temporary container
@@ -758,27 +1042,29 @@ class GameScreen(State):
             if keys[pg.K_RIGHT]:
                 roll_input += 1
             assert roll_input in (-1, 0, 1)
-            self.plane.rot_input_container.roll_input = roll_input
+            rot_inputs.roll_input = roll_input
 
         # Flaps
         if keys[pg.K_z]:  # Flaps up
-            self.plane.flaps += C.FLAPS_SPEED * dt/1000
+            plane.flaps += C.FLAPS_SPEED * dt_s
         if keys[pg.K_x]:  # Flaps down
-            self.plane.flaps -= C.FLAPS_SPEED * dt/1000
-        self.plane.flaps = clamp(self.plane.flaps, (0, 1))
+            plane.flaps -= C.FLAPS_SPEED * dt_s
+        plane.flaps = clamp(plane.flaps, (0, 1))
 
         # Rudder
-        if keys[pg.K_a]:
-            self.plane.rudder -= C.RUDDER_SPEED * dt/1000 * min(1, self.plane.vel.length() / 10)
-        if keys[pg.K_d]:
-            self.plane.rudder += C.RUDDER_SPEED * dt/1000 * min(1, self.plane.vel.length() / 10)
-        if not (keys[pg.K_a] or keys[pg.K_d]):
-            one_minus_decay = (1 - C.RUDDER_SNAPBACK) ** (dt/1000)
-            self.plane.rudder *= one_minus_decay
-        self.plane.rudder = clamp(self.plane.rudder, (-1, 1))
+        if keys[pg.K_a] or keys[pg.K_d]:
+            rudder_step = C.RUDDER_SPEED * dt_s * min(1, plane.vel.length() / 10)
+            if keys[pg.K_a]:
+                plane.rudder -= rudder_step
+            if keys[pg.K_d]:
+                plane.rudder += rudder_step
+        else:
+            one_minus_decay = math.exp(_LN_RUDDER_RETAIN * dt_s)
+            plane.rudder *= one_minus_decay
+        plane.rudder = clamp(plane.rudder, (-1, 1))
 
         # Brakes
-        self.plane.braking = keys[pg.K_b]  # b to brake
+        plane.braking = keys[pg.K_b]  # b to brake
 
         self.update_prev_keys(keys)
 
@@ -815,10 +1101,15 @@ class GameScreen(State):
         self.moon.draw()
 
         # Reduce brightness of drawn objects based on how many cloud layers there
-        # are, and how much coverage each one has
-        cloud_attenuation = 1.0
-        for layer in self.game.config_presets.cloud_configs[self.game.save_data.cloud_config_idx].layers:
-            cloud_attenuation *= (1 - layer.coverage * 0.2)
+        # are, and how much coverage each one has. Only changes with the preset.
+        cloud_config_idx = self.game.save_data.cloud_config_idx
+        if cloud_config_idx != self._cloud_attenuation_idx:
+            cloud_attenuation = 1.0
+            for layer in self.game.config_presets.cloud_configs[cloud_config_idx].layers:
+                cloud_attenuation *= (1 - layer.coverage * 0.2)
+            self._cloud_attenuation = cloud_attenuation
+            self._cloud_attenuation_idx = cloud_config_idx
+        cloud_attenuation = self._cloud_attenuation
 
         self.ground.draw(cloud_attenuation)
         self.ocean.draw(cloud_attenuation)
@@ -826,7 +1117,7 @@ class GameScreen(State):
         for runway in self.game.env.runways:
             runway.draw(cloud_attenuation)
 
-        cloud_layers = self.game.config_presets.cloud_configs[self.game.save_data.cloud_config_idx]
+        cloud_layers = self.game.config_presets.cloud_configs[cloud_config_idx]
         for cloud_layer in cloud_layers.layers:
             cloud_layer.draw(self.plane.pos, camera_fwd)
 
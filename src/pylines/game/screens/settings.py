@@ -22,7 +22,7 @@ from OpenGL import GLU as glu
 import pylines.core.constants as C
 from pylines.core.colours import WHITE
 from pylines.core.custom_types import ConfigValue, EventList, ScancodeWrapper, Surface
-from pylines.core.utils import draw_text
+from pylines.core.utils import create_surface_texture, draw_text, upload_surface_texture
 from pylines.game.states import State, StateID
 from pylines.objects.buttons import Button
 
@@ -47,7 +47,7 @@ class SettingsScreen(State):
         self.display_surface = pg.Surface((C.WN_W, C.WN_H), pg.SRCALPHA)
         self.darken_overlay_surface = pg.Surface((C.WN_W, C.WN_H), pg.SRCALPHA)
 
-        self.texture_id = gl.glGenTextures(1)
+        self.texture_id = create_surface_texture(self.display_surface)
         self.back_button = Button(
             (170, C.WN_H-90), 300, 80, (25, 75, 75), (200, 255, 255),
             "Back to Main Menu", self.fonts.monospaced, 30
@@ -131,14 +131,10 @@ class SettingsScreen(State):
             draw_text(self.display_surface, (int(C.WN_W * 0.35), int(C.WN_H * (0.35 + 0.05 * i))), 'left', 'centre', ui_str, TEXT_COLOUR, 30, self.fonts.monospaced)
             draw_text(self.display_surface, (int(C.WN_W * 0.65), int(C.WN_H * (0.35 + 0.05 * i))), 'right', 'centre', str(option), VAL_COLOUR, 30, self.fonts.monospaced)
 
-        # Convert the Pygame surface to an OpenGL texture
-        texture_data = pg.image.tostring(self.display_surface, 'RGBA', True)
-
         gl.glClear(cast(int, gl.GL_COLOR_BUFFER_BIT) | cast(int, gl.GL_DEPTH_BUFFER_BIT))
-        gl.glBindTexture(gl.GL_TEXTURE_2D, self.texture_id)
-        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR)
-        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR)
-        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA, C.WN_W, C.WN_H, 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, texture_data)
+
+        # Copy the Pygame surface into its OpenGL texture
+        upload_surface_texture(self.display_surface, self.texture_id)
 
         # Set up the projection and modelview matrices for 2D drawing
         gl.glMatrixMode(gl.GL_PROJECTION)
@@ -153,13 +149,14 @@ class SettingsScreen(State):
         # Draw a full-screen quad with the texture
         gl.glEnable(gl.GL_TEXTURE_2D)
         gl.glBegin(gl.GL_QUADS)
-        gl.glTexCoord2f(0, 0)
+        # The texture's rows run top to bottom, so v is flipped against y
+        gl.glTexCoord2f(0, 1)
         gl.glVertex2f(0, 0)
-        gl.glTexCoord2f(1, 0)
-        gl.glVertex2f(C.WN_W, 0)
         gl.glTexCoord2f(1, 1)
+        gl.glVertex2f(C.WN_W, 0)
+        gl.glTexCoord2f(1, 0)
         gl.glVertex2f(C.WN_W, C.WN_H)
-        gl.glTexCoord2f(0, 1)
+        gl.glTexCoord2f(0, 0)
         gl.glVertex2f(0, C.WN_H)
         gl.glEnd()
         gl.glDisable(gl.GL_TEXTURE_2D)
@@ -27,7 +27,13 @@ import pylines.core.constants as C
 from pylines.core.asset_manager import FLine
 from pylines.core.asset_manager_helpers import ControlsSection, ControlsSectionID
 from pylines.core.custom_types import Colour, EventList, ScancodeWrapper, Surface
-from pylines.core.utils import draw_text, draw_transparent_rect, wrap_text
+from pylines.core.utils import (
+    create_surface_texture,
+    draw_text,
+    draw_transparent_rect,
+    upload_surface_texture,
+    wrap_text,
+)
 from pylines.game.states import State, StateID
 from pylines.objects.buttons import Button, ImageButton
 from pylines.game.managers.help_screen import HelpScreen
@@ -39,7 +45,7 @@ class TitleScreen(State):
     def __init__(self, game: Game):
         super().__init__(game)
         self.display_surface = pg.Surface((C.WN_W, C.WN_H), pg.SRCALPHA)
-        self.texture_id = gl.glGenTextures(1)
+        self.texture_id = create_surface_texture(self.display_surface)
 
         self.settings_button = Button(
             (90, C.WN_H-50), 150, 60, (25, 75, 75), (200, 255, 255),
@@ -139,14 +145,10 @@ class TitleScreen(State):
         else:
             self.draw_title_screen()
 
-        # Convert the Pygame surface to an OpenGL texture
-        texture_data = pg.image.tostring(self.display_surface, 'RGBA', True)
-
         gl.glClear(cast(int, gl.GL_COLOR_BUFFER_BIT) | cast(int, gl.GL_DEPTH_BUFFER_BIT))
-        gl.glBindTexture(gl.GL_TEXTURE_2D, self.texture_id)
-        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR)
-        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR)
-        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA, C.WN_W, C.WN_H, 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, texture_data)
+
+        # Copy the Pygame surface into its OpenGL texture
+        upload_surface_texture(self.display_surface, self.texture_id)
 
         # Set up the projection and modelview matrices for 2D drawing
         gl.glMatrixMode(gl.GL_PROJECTION)
@@ -161,13 +163,14 @@ class TitleScreen(State):
         # Draw a full-screen quad with the texture
         gl.glEnable(gl.GL_TEXTURE_2D)
         gl.glBegin(gl.GL_QUADS)
-        gl.glTexCoord2f(0, 0)
+        # The texture's rows run top to bottom, so v is flipped against y
+        gl.glTexCoord2f(0, 1)
         gl.glVertex2f(0, 0)
-        gl.glTexCoord2f(1, 0)
-        gl.glVertex2f(C.WN_W, 0)
         gl.glTexCoord2f(1, 1)
+        gl.glVertex2f(C.WN_W, 0)
+        gl.glTexCoord2f(1, 0)
         gl.glVertex2f(C.WN_W, C.WN_H)
-        gl.glTexCoord2f(0, 1)
+        gl.glTexCoord2f(0, 0)
         gl.glVertex2f(0, C.WN_H)
         gl.glEnd()
         gl.glDisable(gl.GL_TEXTURE_2D)
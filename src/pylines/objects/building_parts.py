@@ -38,6 +38,14 @@ PRIMITIVE_CORRESPONDENCE: dict[str, Primitive] = {
     "sphere": Primitive.SPHERE
 }
 
+# Tessellation of round primitives
+CYLINDER_SEGMENTS = 32
+SPHERE_STACKS = 16
+SPHERE_SECTORS = 32
+
+# Floats per vertex: position (3), colour (3), normal (3), emissive (1)
+FLOATS_PER_VERTEX = 10
+
 def match_primitive(s: str) -> Primitive:
     if s not in PRIMITIVE_CORRESPONDENCE.keys():
         raise RuntimeError(f"Primitive missing correspondence: '{s}'")
@@ -96,7 +104,7 @@ def generate_cuboid_vertices(pos: pg.Vector3, l: float, h: float, w: float, colo
 
     return vertex_data
 
-def generate_cylinder_vertices(pos: pg.Vector3, r: float, h: float, color: tuple[float, float, float], emissive: float, segments: int = 32) -> list[float]:
+def generate_cylinder_vertices(pos: pg.Vector3, r: float, h: float, color: tuple[float, float, float], emissive: float, segments: int = CYLINDER_SEGMENTS) -> list[float]:
     """Generates vertices for a cylinder, including position, color, and normal."""
     vertex_data = []
     angle_step = 2 * math.pi / segments
@@ -164,7 +172,7 @@ def generate_cylinder_vertices(pos: pg.Vector3, r: float, h: float, color: tuple
 
     return vertex_data
 
-def generate_sphere_vertices(pos: pg.Vector3, r: float, color: tuple[float, float, float], emissive: float, stacks: int = 16, sectors: int = 32) -> list[float]:
+def generate_sphere_vertices(pos: pg.Vector3, r: float, color: tuple[float, float, float], emissive: float, stacks: int = SPHERE_STACKS, sectors: int = SPHERE_SECTORS) -> list[float]:
     """Generates vertices for a sphere, including position, color, and normal."""
     vertex_data = []
     stack_step = math.pi / stacks
@@ -236,6 +244,18 @@ def generate_building_part_vertices(world_pos: pg.Vector3, part: "BuildingPart")
     else:
         raise ValueError(f"Missing vertices generator for primitive: {part.primitive.value}")
 
+def building_part_vertex_count(part: "BuildingPart") -> int:
+    """Returns the number of vertices generate_building_part_vertices
+    produces for a part, without generating them."""
+    if part.primitive == Primitive.CUBOID:
+        return 6 * 6  # 6 faces, 2 triangles each
+    elif part.primitive == Primitive.CYLINDER:
+        return CYLINDER_SEGMENTS * (6 + 3 + 3)  # body quad + top and bottom cap triangles
+    elif part.primitive == Primitive.SPHERE:
+        return SPHERE_STACKS * SPHERE_SECTORS * 6
+    else:
+        raise ValueError(f"Missing vertex count for primitive: {part.primitive.value}")
+
 class BuildingPart:
     def __init__(
         self, offset: Coord3, primitive: Primitive, dims: tuple[float, ...],
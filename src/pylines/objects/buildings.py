@@ -13,16 +13,18 @@
 # limitations under the License.
 
 
+import math
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pygame as pg
 
 from pylines.core.custom_types import Colour, RealNumber, Surface
 from pylines.objects.scenery.bases import SmallSceneryObject
 
-from .building_parts import generate_building_part_vertices
+from .building_parts import building_part_vertex_count, generate_building_part_vertices
 
 if TYPE_CHECKING:
     from .building_parts import BuildingPart
@@ -34,12 +36,27 @@ class Building(SmallSceneryObject):
         self.parts = parts
         self.type_ = type_
 
+    @property
+    def vertex_count(self) -> int:
+        return sum(building_part_vertex_count(part) for part in self.parts)
+
     def get_vertices(self) -> list[float]:
         all_vertices: list[float] = []
         for part in self.parts:
             all_vertices.extend(generate_building_part_vertices(self.pos, part))
         return all_vertices
 
+    def write_vertices(self, out: np.ndarray) -> None:
+        """Writes this building's vertices into `out`, a (vertex_count, 10)
+        float32 view into a larger vertex array."""
+        flat_out = out.reshape(-1)  # a view, as `out` is contiguous
+        start = 0
+        for part in self.parts:
+            part_vertices = generate_building_part_vertices(self.pos, part)
+            end = start + len(part_vertices)
+            flat_out[start:end] = part_vertices
+            start = end
+
     def __repr__(self) -> str:
         x, y, z = self.pos
         return f"Building( pos = ({x}, {y}, {z}), parts = {self.parts} )"
@@ -106,3 +123,21 @@ def draw_building_icon(surface: Surface, x: RealNumber, y: RealNumber, appearanc
         # Draw a tiny circle to represent the point
         POINT_RADIUS = 2
         pg.draw.circle(surface, appearance.colour, (int(x), int(y)), POINT_RADIUS / viewport_zoom)
+
+def render_building_icon(appearance: BuildingMapAppearance, viewport_zoom: RealNumber = 1) -> tuple[Surface, int]:
+    """Render a building icon onto its own transparent surface so it can be
+    reused across frames. Returns the surface and the offset of the icon's
+    centre from the surface's top-left corner, along both axes."""
+
+    if appearance.icon == BuildingMapIconType.CIRCLE:
+        extent = appearance.dims[0] / viewport_zoom
+    elif appearance.icon == BuildingMapIconType.SQUARE:
+        extent = max(appearance.dims) / viewport_zoom / 2
+    else:
+        extent = 2 / viewport_zoom  # matches POINT_RADIUS in draw_building_icon
+
+    centre = math.ceil(extent) + 1
+    surf = pg.Surface((centre * 2, centre * 2), pg.SRCALPHA)
+    draw_building_icon(surf, centre, centre, appearance, viewport_zoom)
+
+    return surf, centre
@@ -142,20 +142,11 @@ class Plane(Entity):
         # This only works for rectangular zones that aren't rotated
         # but that's good enough for now since there are no rotated zones.
 
-        for zone in self.env.prohibited_zones:
-            px, _, pz = self.pos
-            zone_centre_x, zone_centre_z = zone.pos
-            zone_w, zone_h = zone.dims
-
-            zone_min_x = zone_centre_x - zone_w / 2
-            zone_max_x = zone_centre_x + zone_w / 2
-            zone_min_z = zone_centre_z - zone_h / 2
-            zone_max_z = zone_centre_z + zone_h / 2
-
-            if zone_min_x < px < zone_max_x and zone_min_z < pz < zone_max_z:
-                return True
-
-        return False
+        px, _, pz = self.pos
+        return any(
+            min_x < px < max_x and min_z < pz < max_z
+            for min_x, max_x, min_z, max_z in self.env.prohibited_zone_bounds
+        )
 
     def reset(self) -> None:
         STARTING_POS = (200, -3_000)
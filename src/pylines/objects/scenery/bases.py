@@ -69,8 +69,8 @@ class CelestialObject(SceneryObject):
         self._load_texture(image_surface)
 
     def _load_texture(self, image_surface: Surface):
-        image_surface = pg.transform.flip(image_surface, False, True)
-        image_data = pg.image.tostring(image_surface, "RGBA", True)
+        # Rows are uploaded top to bottom, as the surface stores them
+        image_data = pg.image.tostring(image_surface, "RGBA")
         self.texture_id = gl.glGenTextures(1)
 
         gl.glBindTexture(gl.GL_TEXTURE_2D, self.texture_id)
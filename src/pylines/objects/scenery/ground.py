@@ -78,9 +78,6 @@ class Ground(LargeSceneryObject):
         yield 1.0, "Uploading terrain indices"
 
     def _build_mesh(self) -> tuple[np.ndarray, np.ndarray]:
-        vertices = []
-        indices = []
-
         res = self.grid_resolution
         size = C.HALF_WORLD_SIZE * 2
         tex_scale = 200.0 / size
@@ -89,63 +86,41 @@ class Ground(LargeSceneryObject):
         xs = np.linspace(-C.HALF_WORLD_SIZE, C.HALF_WORLD_SIZE, res + 1, dtype=np.float32)
         zs = xs.copy()
 
-        # Precompute heights
-        heights = np.empty((res + 1, res + 1), dtype=np.float32)
-        for r, z in enumerate(zs):
-            for c, x in enumerate(xs):
-                heights[r, c] = self.env.height_at(x, z)
-
-        # Preallocate buffers
-        vert_count = (res + 1) * (res + 1)
-        vertices = np.empty(vert_count * 8, dtype=np.float32)
-        indices = np.empty(res * res * 6, dtype=np.uint32)
+        # Precompute heights, sampled in one vectorised pass (rows are z, columns x)
+        heights = self.env.heights_at(xs[np.newaxis, :], zs[:, np.newaxis]).astype(np.float32)
 
         dx = C.NORMAL_CALC_EPSILON
         inv_2dx = 1.0 / (2.0 * dx)
 
-        vi = 0  # vertex write index
-
-        # Vertices
-        for r in range(res + 1):
-            for c in range(res + 1):
-                x = xs[c]
-                z = zs[r]
-                y = heights[r, c]
-
-                # texture coords
-                u = (x + C.HALF_WORLD_SIZE) * tex_scale
-                v = (z + C.HALF_WORLD_SIZE) * tex_scale
-
-                # normal via central differences
-                hL = heights[r, max(c - 1, 0)]
-                hR = heights[r, min(c + 1, res)]
-                hD = heights[max(r - 1, 0), c]
-                hU = heights[min(r + 1, res), c]
-
-                nx = (hL - hR) * inv_2dx
-                ny = 1.0
-                nz = (hD - hU) * inv_2dx
-
-                inv_len = 1.0 / (nx * nx + ny * ny + nz * nz) ** 0.5
-                nx *= inv_len
-                ny *= inv_len
-                nz *= inv_len
-
-                vertices[vi:vi + 8] = (x, y, z, u, v, nx, ny, nz)
-                vi += 8
-
-        # Indices
-        ii = 0
+        # Normals via central differences, clamped at the edges of the grid
+        idx = np.arange(res + 1)
+        prev_idx = np.maximum(idx - 1, 0)
+        next_idx = np.minimum(idx + 1, res)
+
+        nx = (heights[:, prev_idx] - heights[:, next_idx]) * inv_2dx
+        nz = (heights[prev_idx, :] - heights[next_idx, :]) * inv_2dx
+        inv_len = 1.0 / (nx * nx + 1.0 + nz * nz) ** 0.5
+
+        # Vertices, interleaved as (x, y, z, u, v, nx, ny, nz)
+        grid_x, grid_z = np.meshgrid(xs, zs)
+        vertices = np.stack((
+            grid_x,
+            heights,
+            grid_z,
+            (grid_x + C.HALF_WORLD_SIZE) * tex_scale,  # texture coords
+            (grid_z + C.HALF_WORLD_SIZE) * tex_scale,
+            nx * inv_len,
+            inv_len,  # ny is 1 before normalising
+            nz * inv_len,
+        ), axis=-1).astype(np.float32).ravel()
+
+        # Indices, two triangles (a, b, d) and (a, d, c) per grid cell
         stride = res + 1
-        for r in range(res):
-            for c in range(res):
-                a = r * stride + c
-                b = a + 1
-                c_ = a + stride
-                d = c_ + 1
-
-                indices[ii:ii + 6] = (a, b, d, a, d, c_)
-                ii += 6
+        a = (np.arange(res, dtype=np.uint32)[:, np.newaxis] * stride + np.arange(res, dtype=np.uint32)).ravel()
+        b = a + 1
+        c_ = a + stride
+        d = c_ + 1
+        indices = np.stack((a, b, d, a, d, c_), axis=-1).ravel()
 
         return vertices, indices
 
@@ -170,9 +145,8 @@ class Ground(LargeSceneryObject):
         gl.glBindBuffer(gl.GL_ELEMENT_ARRAY_BUFFER, 0)
 
     def _load_texture(self, image_surface: Surface) -> int:
-        # OpenGL textures are Y-flipped compared to Pygame
-        image_surface = pg.transform.flip(image_surface, False, True)
-        image_data = pg.image.tostring(image_surface, "RGBA", True)  # Get pixel data
+        # Rows are uploaded top to bottom, as the surface stores them
+        image_data = pg.image.tostring(image_surface, "RGBA")  # Get pixel data
 
         # Generate OpenGL texture ID
         texture_id = gl.glGenTextures(1)
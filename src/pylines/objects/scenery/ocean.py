@@ -58,8 +58,8 @@ class Ocean(LargeSceneryObject):
         self.vbo, self.ebo = self._setup_buffers()
 
     def _load_texture(self, image_surface: Surface) -> int:
-        image_surface = pg.transform.flip(image_surface, False, True)
-        image_data = pg.image.tostring(image_surface, "RGBA", True)
+        # Rows are uploaded top to bottom, as the surface stores them
+        image_data = pg.image.tostring(image_surface, "RGBA")
         texture_id = gl.glGenTextures(1)
         gl.glBindTexture(gl.GL_TEXTURE_2D, texture_id)
         gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR)
@@ -71,44 +71,32 @@ class Ocean(LargeSceneryObject):
         return texture_id
 
     def _build_mesh(self) -> tuple[np.ndarray, np.ndarray]:
-        vertices = []
-        indices = []
-
         res = self.grid_resolution
         step = C.HALF_WORLD_SIZE * 2 / res
         texture_scale = self.texture_repeat_count / (C.HALF_WORLD_SIZE * 2)
 
-        def vert_index(r: int, c: int) -> int:
-            return r * (res + 1) + c
-
         # ---- vertices ----
-        for r in range(res + 1):
-            for c in range(res + 1):
-                x = -C.HALF_WORLD_SIZE + c * step
-                z = -C.HALF_WORLD_SIZE + r * step
-                y = self.env.sea_level
-                terrain_y = self.env.height_at(x, z)
-
-                u = (x + C.HALF_WORLD_SIZE) * texture_scale
-                v = (z + C.HALF_WORLD_SIZE) * texture_scale
-
-                vertices.extend([x, y, z, u, v, terrain_y])
+        coords = -C.HALF_WORLD_SIZE + np.arange(res + 1) * step
+        grid_x, grid_z = np.meshgrid(coords, coords)  # rows are z, columns x
+        terrain_y = self.env.heights_at(coords[np.newaxis, :], coords[:, np.newaxis])
+
+        vertices = np.stack((
+            grid_x,
+            np.full_like(grid_x, self.env.sea_level),
+            grid_z,
+            (grid_x + C.HALF_WORLD_SIZE) * texture_scale,
+            (grid_z + C.HALF_WORLD_SIZE) * texture_scale,
+            terrain_y,
+        ), axis=-1).astype(np.float32).ravel()
 
         # ---- indices ----
-        for r in range(res):
-            for c in range(res):
-                vA = vert_index(r, c)
-                vB = vert_index(r, c + 1)
-                vC = vert_index(r + 1, c)
-                vD = vert_index(r + 1, c + 1)
-
-                indices.extend([vA, vB, vD])
-                indices.extend([vA, vD, vC])
-
-        return (
-            np.array(vertices, dtype=np.float32),
-            np.array(indices, dtype=np.uint32),
-        )
+        vA = (np.arange(res, dtype=np.uint32)[:, np.newaxis] * (res + 1) + np.arange(res, dtype=np.uint32)).ravel()
+        vB = vA + 1
+        vC = vA + (res + 1)
+        vD = vC + 1
+        indices = np.stack((vA, vB, vD, vA, vD, vC), axis=-1).ravel()
+
+        return vertices, indices
 
     def _setup_buffers(self):
         vbo = gl.glGenBuffers(1)
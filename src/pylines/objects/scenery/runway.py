@@ -63,9 +63,8 @@ class Runway(LargeSceneryObject):
         draw_text(texture_surface, (int(self.w * 2), 150), 'centre', 'centre', str(round(self.heading/10)), (255, 255, 255, 255), 150, fonts.monospaced, rotation=180)
         draw_text(texture_surface, (int(self.w * 2), int(self.l * 4) - 150), 'centre', 'centre', str((round(self.heading/10) + 18) % 36), (255, 255, 255, 255), 150, fonts.monospaced)
 
-        # Flip the surface vertically for OpenGL
-        image_surface = pg.transform.flip(texture_surface, False, True)
-        image_data = pg.image.tostring(image_surface, "RGBA", True)
+        # Rows are uploaded top to bottom, as the surface stores them
+        image_data = pg.image.tostring(texture_surface, "RGBA")
 
         # Generate OpenGL texture ID
         self.texture_id = gl.glGenTextures(1)
@@ -78,7 +77,7 @@ class Runway(LargeSceneryObject):
         gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T, gl.GL_CLAMP_TO_EDGE)
 
         # Upload texture data to OpenGL
-        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA, image_surface.get_width(), image_surface.get_height(), 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, image_data)
+        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA, texture_surface.get_width(), texture_surface.get_height(), 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, image_data)
         gl.glBindTexture(gl.GL_TEXTURE_2D, 0)  # Unbind texture
 
     def draw(self, cloud_attenuation):
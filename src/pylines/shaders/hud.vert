@@ -0,0 +1,27 @@
+// Copyright 2025-2026 Louis Masarei-Boulton
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#version 120
+
+attribute vec2 position;
+attribute vec2 tex_coord;
+
+uniform mat4 u_projection;
+
+varying vec2 v_tex_coord;
+
+void main() {
+    gl_Position = u_projection * vec4(position, 0.0, 1.0);
+    v_tex_coord = tex_coord;
+}